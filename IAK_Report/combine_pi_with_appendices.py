@@ -23,6 +23,8 @@ Process:
 
 Dependencies:
 - PyPDF2 or pypdf: For PDF merging operations
+- pypdfium2 (optional): For fast text search in the PI report, falls back to pypdf
+- pikepdf (optional): For fast PDF merging with qpdf, falls back to pypdf
 - src.utils: Custom utility functions for configuration and file handling
 
 Usage:
@@ -30,11 +32,18 @@ Run the script as a standalone program to combine PI reports with appendices for
 """
 
 # Built-in modules
+import io
 import os
+import json
+import hashlib
 import logging
 import datetime as dt
-from typing import Optional, List, Tuple
-from pypdf import PdfWriter, PdfReader
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional, List, Tuple
+
+# The PDF libraries are imported in the functions that use them, so they are only
+# loaded when an object actually has PDFs to combine
+if TYPE_CHECKING:
+    from pypdf import PdfWriter, PdfReader
 
 # Local imports
 from . import utils
@@ -46,6 +55,10 @@ BIJLAGE_6_PATTERN = "bijlage 6"
 BIJLAGE_9_PATTERN = "bijlage 9"
 EXCLUDE_COMPLEET = "compleet"
 
+# Cache directory with the insertion points found per PI report. It is kept next to the
+# configuration instead of in the output folders, as those are delivered
+INSERTION_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(utils.CONFIG_FILE)), ".insertion_cache")
+
 
 def find_most_recent_file(directory: str, pattern: str, exclude_pattern: str = None) -> Optional[str]:
     """
@@ -59,33 +72,186 @@ def find_most_recent_file(directory: str, pattern: str, exclude_pattern: str = N
     Returns:
         str: Full path to the most recent matching file, or None if not found.
     """
-    logging.debug(f"Searching recursively for files matching pattern '{pattern}' in [{directory}]")
+    excludes = {pattern: exclude_pattern} if exclude_pattern else None
+    return find_most_recent_files(directory, {pattern: pattern}, excludes)[pattern]
+
+
+def find_most_recent_files(directory: str, patterns: Dict[str, str],
+                           excludes: Optional[Dict[str, str]] = None) -> Dict[str, Optional[str]]:
+    """
+    Find the most recent file for each of several patterns in a single pass over the
+    specified directory and its subdirectories.
     
-    if not os.path.exists(directory):
-        logging.warning(f"Directory does not exist: [{directory}]")
-        return None
+    Parameters:
+        directory (str): Directory to search in (recursively).
+        patterns (dict): Key -> case-insensitive substring that the filename must contain.
+        excludes (dict): Optional key -> case-insensitive substring that excludes a file for that key only.
     
-    matching_files = []
+    Returns:
+        dict: Key -> full path to the most recent matching file, or None if not found.
+    """
+    logging.debug(f"Searching recursively for files matching patterns {list(patterns.values())} in [{directory}]")
     
-    # Search recursively for files matching the pattern
-    for root, dirs, files in os.walk(directory):
-        for filename in files:
-            if pattern.lower() in filename.lower() and filename.lower().endswith('.pdf'):
-                # Exclude files matching the exclude pattern
-                if exclude_pattern and exclude_pattern.lower() in filename.lower():
+    most_recent = {key: None for key in patterns}
+    if not os.path.exists(directory):
+        logging.warning(f"Directory does not exist: [{directory}]")
+        return most_recent
+    
+    excludes = excludes or {}
+    patterns_lower = [
+        (key, pattern.lower(), excludes[key].lower() if excludes.get(key) else None)
+        for key, pattern in patterns.items()
+    ]
+    most_recent_mtime = {key: -1.0 for key in patterns}
+    
+    # Search recursively for files matching the patterns, keeping track of the most recent one per pattern.
+    # os.scandir returns the file attributes with the directory listing, so no extra stat call per file.
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError as e:
+            # Same as os.walk: skip directories that cannot be listed
+            logging.debug(f"Skipping directory: {e}")
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
                     continue
-                file_path = os.path.join(root, filename)
-                matching_files.append(file_path)
-                logging.debug(f"Found matching file: [{filename}] in [{root}]")
+                name_lower = entry.name.lower()
+                if not name_lower.endswith('.pdf'):
+                    continue
+                mtime = None
+                for key, pattern_lower, exclude_lower in patterns_lower:
+                    if pattern_lower not in name_lower:
+                        continue
+                    # Exclude files matching the exclude pattern of this key
+                    if exclude_lower and exclude_lower in name_lower:
+                        continue
+                    logging.debug(f"Found matching file: [{entry.path}]")
+                    if mtime is None:
+                        mtime = entry.stat().st_mtime
+                    if mtime > most_recent_mtime[key]:
+                        most_recent[key] = entry.path
+                        most_recent_mtime[key] = mtime
+    
+    for key, path in most_recent.items():
+        if path is None:
+            logging.info(f"No files found matching pattern '{patterns[key]}' in [{directory}] or its subdirectories")
+        else:
+            logging.info(f"Most recent file: [{os.path.basename(path)}]")
+    return most_recent
+
+
+def combined_pdf_is_up_to_date(object_path: str, output_dir: str) -> Tuple[bool, bool]:
+    """
+    Check whether the combined PDF of an object is newer than all of its input PDFs.
+    Only file modification times are compared, no PDF content is read.
     
-    if not matching_files:
-        logging.info(f"No files found matching pattern '{pattern}' in [{directory}] or its subdirectories")
-        return None
+    Parameters:
+        object_path (str): Path to the object directory.
+        output_dir (str): Directory that contains the combined PDF.
     
-    # Return the most recent file based on modification time
-    most_recent = max(matching_files, key=os.path.getmtime)
-    logging.info(f"Most recent file: [{os.path.basename(most_recent)}]")
-    return most_recent
+    Returns:
+        tuple: (up_to_date, missing_bijlage_6)
+            - up_to_date (bool): True if a combined PDF exists, the PI report and Bijlage 3 and 9
+              are still present and no input PDF is newer
+            - missing_bijlage_6 (bool): True if no bijlage 6 was found
+    """
+    suffix = f" - {EXCLUDE_COMPLEET}.pdf"
+    output_mtime = None
+    try:
+        with os.scandir(output_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(suffix) and entry.is_file():
+                    mtime = entry.stat().st_mtime
+                    if output_mtime is None or mtime > output_mtime:
+                        output_mtime = mtime
+    except OSError:
+        return False, False
+    if output_mtime is None:
+        return False, False
+
+    appendix_patterns = (BIJLAGE_3_PATTERN, BIJLAGE_6_PATTERN, BIJLAGE_9_PATTERN)
+    missing_bijlage_6 = True
+    found_pi_report = found_bijlage_3 = found_bijlage_9 = False
+    stack = [object_path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                    continue
+                name_lower = entry.name.lower()
+                if not name_lower.endswith('.pdf'):
+                    continue
+                # Same selection as process_object: "compleet" only excludes PI report files
+                is_pi_report = PI_RAPPORT_PATTERN in name_lower and EXCLUDE_COMPLEET not in name_lower
+                if not is_pi_report and not any(pattern in name_lower for pattern in appendix_patterns):
+                    continue
+                # Stop at the first input that changed after the combined PDF was written
+                if entry.stat().st_mtime > output_mtime:
+                    return False, False
+                found_pi_report = found_pi_report or is_pi_report
+                found_bijlage_3 = found_bijlage_3 or BIJLAGE_3_PATTERN in name_lower
+                found_bijlage_9 = found_bijlage_9 or BIJLAGE_9_PATTERN in name_lower
+                if BIJLAGE_6_PATTERN in name_lower:
+                    missing_bijlage_6 = False
+
+    # A combined PDF whose required inputs have disappeared is not up-to-date; process_object
+    # reports the missing files
+    if not (found_pi_report and found_bijlage_3 and found_bijlage_9):
+        return False, missing_bijlage_6
+    return True, missing_bijlage_6
+
+
+def _iter_pages_search(pdf_path: str) -> Iterator[Tuple[int, Callable[[str], bool]]]:
+    """
+    Yield (page_num, contains) for every page of a PDF, from the last page backwards.
+    `contains(search_text_lower)` tells whether the page contains the lowercase text (case-insensitive).
+
+    With pypdfium2 the search runs inside PDFium on the text layer of the page, without
+    building a Python string of the page. Otherwise the page text is extracted with pypdf.
+    """
+    try:
+        # PDFium (C++) extracts page text much faster than pypdf, which is pure Python
+        import pypdfium2 as pdfium
+    except ImportError:
+        pdfium = None
+
+    if pdfium is not None:
+        pdf = pdfium.PdfDocument(pdf_path)
+        try:
+            for page_num in range(len(pdf) - 1, -1, -1):
+                page = pdf[page_num]
+                textpage = page.get_textpage()
+
+                def contains(search_text_lower: str) -> bool:
+                    searcher = textpage.search(search_text_lower, match_case=False, match_whole_word=False)
+                    found = searcher.get_next() is not None
+                    searcher.close()
+                    return found
+
+                try:
+                    yield page_num, contains
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+    else:
+        from pypdf import PdfReader
+
+        with open(pdf_path, 'rb') as file:
+            reader = PdfReader(file)
+            for page_num in range(len(reader.pages) - 1, -1, -1):
+                text_lower = (reader.pages[page_num].extract_text() or "").lower()
+                yield page_num, lambda search_text_lower: search_text_lower in text_lower
 
 
 def find_last_page_with_text(pdf_path: str, search_text: str) -> Optional[int]:
@@ -99,98 +265,313 @@ def find_last_page_with_text(pdf_path: str, search_text: str) -> Optional[int]:
     Returns:
         int: Page number (0-indexed) of the last occurrence, or None if not found.
     """
-    logging.debug(f"Searching for '{search_text}' in [{os.path.basename(pdf_path)}]")
-    
+    return find_last_pages_with_texts(pdf_path, [search_text])[search_text]
+
+
+def find_last_pages_with_texts(pdf_path: str, search_texts: List[str]) -> Dict[str, Optional[int]]:
+    """
+    Find, for several texts at once, the last page number in a PDF that contains the text.
+
+    The pages are read only once, from the last page backwards, and the search stops
+    as soon as every text has been found.
+
+    Parameters:
+        pdf_path (str): Path to the PDF file.
+        search_texts (list): Texts to search for (case-insensitive).
+
+    Returns:
+        dict: Mapping of each search text to the page number (0-indexed) of its
+              last occurrence, or None if not found.
+    """
+    logging.debug(f"Searching for {search_texts} in [{os.path.basename(pdf_path)}]")
+    result = {search_text: None for search_text in search_texts}
+    # Lowercase the search texts once instead of on every page
+    remaining = [(search_text, search_text.lower()) for search_text in search_texts]
+
     try:
-        with open(pdf_path, 'rb') as file:
-            reader = PdfReader(file)
-            last_page = None
-            
-            for page_num in range(len(reader.pages)):
-                page = reader.pages[page_num]
-                text = page.extract_text()
-                
-                if search_text.lower() in text.lower():
-                    last_page = page_num
-                    logging.debug(f"Found '{search_text}' on page {page_num + 1}")
-            
-            if last_page is not None:
-                logging.info(f"Last occurrence of '{search_text}' on page {last_page + 1}")
-            else:
-                logging.warning(f"'{search_text}' not found in PDF")
-            
-            return last_page
-    
+        # Search backwards, so the first hit is the last occurrence
+        for page_num, contains in _iter_pages_search(pdf_path):
+            for search_text, search_text_lower in list(remaining):
+                if contains(search_text_lower):
+                    remaining.remove((search_text, search_text_lower))
+                    result[search_text] = page_num
+                    logging.info(f"Last occurrence of '{search_text}' on page {page_num + 1}")
+
+            if not remaining:
+                break
+
     except Exception as e:
         logging.error(f"Error searching PDF: {e}")
-        return None
+
+    for search_text, _ in remaining:
+        logging.warning(f"'{search_text}' not found in PDF")
+
+    return result
+
+
+def _insertion_cache_key(pdf_path: str) -> str:
+    """
+    Fingerprint of a PDF based on its first 64 KiB and its modification time.
+    Cheaper than hashing the whole (multi-MB) file, and changes whenever the file is rewritten.
+    """
+    with open(pdf_path, 'rb') as file:
+        head = file.read(65536)
+    fingerprint = head + str(os.path.getmtime(pdf_path)).encode()
+    return hashlib.blake2b(fingerprint, digest_size=16).hexdigest()
+
+
+def _insertion_cache_path(pdf_path: str, cache_dir: str) -> str:
+    """
+    Cache file of a PDF in the cache directory. There is one file per PDF path,
+    so the results for a rewritten PDF replace those of its earlier version.
+    """
+    name = hashlib.blake2b(os.path.normcase(os.path.abspath(pdf_path)).encode(), digest_size=16).hexdigest()
+    return os.path.join(cache_dir, f"{name}.json")
 
 
-def find_insertion_points(pi_report_path: str, appendices: List[Tuple[Optional[str], str, str]]) -> List[Tuple[Optional[int], str]]:
+def find_last_pages_cached(pdf_path: str, search_texts: List[str], cache_dir: str) -> Dict[str, Optional[int]]:
+    """
+    Same as `find_last_pages_with_texts`, but the results are stored in a JSON cache file,
+    so an unchanged PDF is not searched again on the next run.
+
+    Parameters:
+        pdf_path (str): Path to the PDF file.
+        search_texts (list): Texts to search for (case-insensitive).
+        cache_dir (str): Directory with the JSON cache files.
+
+    Returns:
+        dict: Mapping of each search text to the page number (0-indexed) of its
+              last occurrence, or None if not found.
+    """
+    key = _insertion_cache_key(pdf_path)
+    cache_path = _insertion_cache_path(pdf_path, cache_dir)
+
+    try:
+        with open(cache_path, 'r') as file:
+            cache = json.load(file)
+    except (OSError, ValueError):
+        cache = {}
+
+    # The results for an earlier version of the PDF are not used
+    cached = cache.get("pages", {}) if cache.get("key") == key else {}
+    missing = [search_text for search_text in search_texts if search_text not in cached]
+    if not missing:
+        logging.info(f"Using cached insertion points for [{os.path.basename(pdf_path)}]")
+        return {search_text: cached[search_text] for search_text in search_texts}
+
+    searched = find_last_pages_with_texts(pdf_path, missing)
+
+    # Only found pages are stored: None may also come from an unreadable PDF or a failed
+    # search, which has to be searched again on the next run
+    found = {search_text: page for search_text, page in searched.items() if page is not None}
+    if found:
+        cached.update(found)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            with open(cache_path, 'w') as file:
+                json.dump({"source": pdf_path, "key": key, "pages": cached}, file, indent=2)
+        except OSError as e:
+            logging.warning(f"Could not write insertion point cache [{cache_path}]: {e}")
+
+    return {search_text: cached.get(search_text, searched.get(search_text)) for search_text in search_texts}
+
+
+def prune_insertion_cache(cache_dir: str) -> None:
+    """
+    Remove the cache files of PDFs that no longer exist, so the cache does not keep growing.
+
+    Parameters:
+        cache_dir (str): Directory with the JSON cache files.
+    """
+    try:
+        entries = list(os.scandir(cache_dir))
+    except OSError:
+        return
+
+    for entry in entries:
+        if not entry.name.endswith(".json"):
+            continue
+        try:
+            with open(entry.path, 'r') as file:
+                source = json.load(file).get("source")
+        except (OSError, ValueError, AttributeError):
+            source = None
+        if not source or not os.path.exists(source):
+            try:
+                os.remove(entry.path)
+            except OSError as e:
+                logging.warning(f"Could not remove insertion point cache [{entry.path}]: {e}")
+
+
+def find_insertion_points(pi_report_path: str, appendices: List[Tuple[Optional[str], str, str]],
+                          cache_dir: Optional[str] = None,
+                          overrides: Optional[Dict[str, Optional[int]]] = None) -> List[Tuple[Optional[int], str]]:
     """
     Find insertion points for appendices in the PI report.
     
     Parameters:
         pi_report_path (str): Path to the PI report PDF.
         appendices (list): List of tuples (pdf_path, search_pattern, name).
+        cache_dir (str): Optional directory with the JSON cache files of earlier search results.
+        overrides (dict): Optional fixed insertion points per search pattern, e.g. {"bijlage 3": 12}.
+            The value is the page index (0-indexed) after which the appendix is inserted;
+            -1 or None appends it at the end. The PI report is not searched for these patterns.
     
     Returns:
         list: List of tuples (insert_page_index, appendix_name) with insertion points found.
     """
     insertion_points = []
-    
+
+    # Fixed insertion points from the configuration, -1 means append at the end
+    last_pages = {}
+    for search_pattern, insert_page in (overrides or {}).items():
+        last_pages[search_pattern.lower()] = None if insert_page is None or insert_page < 0 else insert_page
+    fixed_patterns = set(last_pages)
+
+    # Search the PI report once for the references to all other present appendices
+    search_patterns = [search_pattern for pdf_path, search_pattern, _ in appendices
+                       if pdf_path and search_pattern not in last_pages]
+    if search_patterns and cache_dir:
+        last_pages.update(find_last_pages_cached(pi_report_path, search_patterns, cache_dir))
+    elif search_patterns:
+        last_pages.update(find_last_pages_with_texts(pi_report_path, search_patterns))
+
     for pdf_path, search_pattern, name in appendices:
         if pdf_path:
-            insert_page = find_last_page_with_text(pi_report_path, search_pattern)
-            if insert_page is None:
+            insert_page = last_pages[search_pattern]
+            if search_pattern in fixed_patterns:
+                logging.info(f"Using configured insertion point for '{name}'")
+            elif insert_page is None:
                 logging.warning(f"'{name}' reference not found in PI report, will append at end")
             insertion_points.append((insert_page, pdf_path, name))
     
     return insertion_points
 
 
-def build_merged_pdf(pi_report_path: str, insertion_points: List[Tuple[Optional[int], str, str]]) -> PdfWriter:
+def validate_insertion_points(insertion_points: List[Tuple[Optional[int], str, str]],
+                              page_count: int) -> List[Tuple[Optional[int], str, str]]:
+    """
+    Check the insertion points against the number of pages in the PI report.
+
+    Insertion points beyond the last page (e.g. a configured override for a shorter report)
+    are appended at the end of the document instead.
+
+    Parameters:
+        insertion_points (list): List of tuples (insert_page, pdf_path, name).
+        page_count (int): Number of pages in the PI report.
+
+    Returns:
+        list: List of tuples (insert_page, pdf_path, name) with valid page indices or None.
+    """
+    valid_points = []
+    for insert_page, pdf_path, name in insertion_points:
+        if insert_page is not None and insert_page >= page_count:
+            logging.warning(f"Insertion point for '{name}' (page {insert_page + 1}) is beyond the "
+                            f"last page of the PI report ({page_count}), will append at end")
+            insert_page = None
+        valid_points.append((insert_page, pdf_path, name))
+    return valid_points
+
+
+def build_merged_pdf(pi_report_path: str, insertion_points: List[Tuple[Optional[int], str, str]],
+                     readers: Dict[str, "PdfReader"]) -> "PdfWriter":
     """
     Build a merged PDF with appendices inserted at specified positions.
     
     Parameters:
         pi_report_path (str): Path to the main PI report PDF.
         insertion_points (list): List of tuples (insert_page, pdf_path, name).
+        readers (dict): Opened PdfReader per appendix path.
     
     Returns:
         PdfWriter: Writer object with merged content.
     """
+    from pypdf import PdfWriter, PdfReader
+
     writer = PdfWriter()
-    
-    # Add the main PI report
-    writer.append(pi_report_path)
+    main_reader = PdfReader(pi_report_path)
+    insertion_points = validate_insertion_points(insertion_points, len(main_reader.pages))
+
+    # Schedule the appendices per page of the PI report after which they are inserted;
+    # appendices without a reference in the document are appended at the end
+    schedule = {}
+    insertions_without_pages = []
+    for insert_page, pdf_path, name in insertion_points:
+        if insert_page is not None:
+            schedule.setdefault(insert_page, []).append((pdf_path, name))
+        else:
+            insertions_without_pages.append((pdf_path, name))
+
+    # Build the page list in one linear pass over the PI report
+    for page_num, page in enumerate(main_reader.pages):
+        writer.add_page(page)
+        for pdf_path, name in schedule.get(page_num, []):
+            for appendix_page in readers[pdf_path].pages:
+                writer.add_page(appendix_page)
+            logging.info(f"Inserted {name} after page {page_num + 1}")
     logging.info(f"Added PI report: [{os.path.basename(pi_report_path)}]")
-    
-    # Separate insertions with page numbers from those without
-    insertions_with_pages = [(page, path, name) for page, path, name in insertion_points if page is not None]
-    insertions_without_pages = [(page, path, name) for page, path, name in insertion_points if page is None]
-    
-    # Sort by page number (insert from last to first to maintain correct indices)
-    insertions_with_pages.sort(key=lambda x: x[0], reverse=True)
-    
-    # Insert appendices at their designated positions (from last to first)
-    for insert_page, pdf_path, name in insertions_with_pages:
-        # insert_page is 0-indexed, add 1 to insert after that page
-        insert_position = insert_page + 1
-        writer.merge(insert_position, pdf_path)
-        logging.info(f"Inserted {name} after page {insert_page + 1}")
-    
-    # Append any appendices that don't have a reference in the document
-    for _, pdf_path, name in insertions_without_pages:
-        writer.append(pdf_path)
+
+    for pdf_path, name in insertions_without_pages:
+        for appendix_page in readers[pdf_path].pages:
+            writer.add_page(appendix_page)
         logging.info(f"Appended {name} at end of document")
     
     return writer
 
 
+def write_merged_pdf_pikepdf(pi_report_path: str, insertion_points: List[Tuple[Optional[int], str, str]],
+                             output_path: str) -> None:
+    """
+    Merge the appendices into the PI report with pikepdf (qpdf) and save the result.
+    
+    Parameters:
+        pi_report_path (str): Path to the main PI report PDF.
+        insertion_points (list): List of tuples (insert_page, pdf_path, name).
+        output_path (str): Path where the combined PDF will be saved.
+    """
+    import pikepdf
+
+    sources = []
+    try:
+        with pikepdf.Pdf.open(pi_report_path) as pdf:
+            logging.info(f"Added PI report: [{os.path.basename(pi_report_path)}]")
+            insertion_points = validate_insertion_points(insertion_points, len(pdf.pages))
+
+            # Insert from the last to the first page to keep the page indices valid.
+            # Appendices referenced on the same page are kept in their original order.
+            insertions_with_pages = sorted(
+                ((insert_page, order, pdf_path, name)
+                 for order, (insert_page, pdf_path, name) in enumerate(insertion_points)
+                 if insert_page is not None),
+                reverse=True,
+            )
+            for insert_page, _, pdf_path, name in insertions_with_pages:
+                source = pikepdf.Pdf.open(pdf_path)
+                sources.append(source)
+                # insert_page is 0-indexed, add 1 to insert after that page
+                insert_position = insert_page + 1
+                for i, page in enumerate(source.pages):
+                    pdf.pages.insert(insert_position + i, page)
+                logging.info(f"Inserted {name} after page {insert_page + 1}")
+
+            # Append any appendices that don't have a reference in the document
+            for insert_page, pdf_path, name in insertion_points:
+                if insert_page is None:
+                    source = pikepdf.Pdf.open(pdf_path)
+                    sources.append(source)
+                    pdf.pages.extend(source.pages)
+                    logging.info(f"Appended {name} at end of document")
+
+            logging.debug(f"Writing combined PDF to: [{output_path}]")
+            pdf.save(output_path, linearize=False, object_stream_mode=pikepdf.ObjectStreamMode.generate)
+    finally:
+        for source in sources:
+            source.close()
+
+
 def combine_pdfs(pi_report_path: str, bijlage_3_path: Optional[str], 
                  bijlage_6_path: Optional[str], bijlage_9_path: Optional[str], 
-                 output_path: str) -> bool:
+                 output_path: str, insertion_overrides: Optional[Dict[str, Optional[int]]] = None) -> bool:
     """
     Combine the PI report with appendices into a single PDF.
     
@@ -205,6 +586,8 @@ def combine_pdfs(pi_report_path: str, bijlage_3_path: Optional[str],
         bijlage_6_path (str): Path to Bijlage 6 PDF (optional).
         bijlage_9_path (str): Path to Bijlage 9 PDF (optional).
         output_path (str): Path where the combined PDF will be saved.
+        insertion_overrides (dict): Optional fixed insertion points per search pattern,
+            see find_insertion_points.
     
     Returns:
         bool: True if successful, False otherwise.
@@ -219,16 +602,41 @@ def combine_pdfs(pi_report_path: str, bijlage_3_path: Optional[str],
             (bijlage_9_path, BIJLAGE_9_PATTERN, "Bijlage 9")
         ]
         
-        # Find insertion points for all appendices
-        insertion_points = find_insertion_points(pi_report_path, appendices)
-        
-        # Build the merged PDF
-        writer = build_merged_pdf(pi_report_path, insertion_points)
+        # Find insertion points for all appendices, reusing earlier results for an unchanged PI report
+        insertion_points = find_insertion_points(pi_report_path, appendices, INSERTION_CACHE_DIR,
+                                                 insertion_overrides)
         
-        # Write the combined PDF
-        logging.debug(f"Writing combined PDF to: [{output_path}]")
-        with open(output_path, 'wb') as output_file:
-            writer.write(output_file)
+        try:
+            # qpdf (C++) merges PDFs much faster than pypdf
+            import pikepdf
+        except ImportError:
+            pikepdf = None
+
+        if pikepdf is not None:
+            # Build and write the merged PDF with qpdf
+            write_merged_pdf_pikepdf(pi_report_path, insertion_points, output_path)
+        else:
+            from pypdf import PdfReader
+
+            # Open every appendix once
+            readers = {}
+            try:
+                for _, pdf_path, _ in insertion_points:
+                    readers[pdf_path] = PdfReader(pdf_path)
+
+                # Build the merged PDF
+                writer = build_merged_pdf(pi_report_path, insertion_points, readers)
+
+                # Drop duplicate and unused objects to reduce the output size
+                writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+
+                # Write the combined PDF through a large buffer, to coalesce the many small writes
+                logging.debug(f"Writing combined PDF to: [{output_path}]")
+                with open(output_path, 'wb', buffering=0) as raw, io.BufferedWriter(raw, buffer_size=1 << 20) as output_file:
+                    writer.write(output_file)
+            finally:
+                for reader in readers.values():
+                    reader.close()
         
         logging.info(f"Successfully created combined PDF: [{os.path.basename(output_path)}]")
         return True
@@ -238,7 +646,7 @@ def combine_pdfs(pi_report_path: str, bijlage_3_path: Optional[str],
         return False
 
 
-def process_object(object_path: str, object_code: str, config: dict, logger) -> bool:
+def process_object(object_path: str, object_code: str, config: dict, logger=None) -> bool:
     """
     Process a single object: find PI report and appendices, then combine them.
     
@@ -246,46 +654,50 @@ def process_object(object_path: str, object_code: str, config: dict, logger) ->
         object_path (str): Path to the object directory.
         object_code (str): Code identifying the object.
         config (dict): Configuration dictionary.
-        logger: Logger instance for logging.
+        logger: Logger instance for logging. If None (e.g. in a worker process),
+            the module logger is used.
     
     Returns:
         tuple: (success_status, missing_bijlage_6)
             - success_status (bool): True if processing succeeded, False otherwise
             - missing_bijlage_6 (bool): True if bijlage 6 was missing
     """
+    if logger is None:
+        logger = logging.getLogger(__name__)
     logger.info(f"Processing object [{object_code}]")
     
     # Determine the output directory
     output_folder = config.get("output_folder", "")
     output_dir = os.path.join(object_path, output_folder)
+
+    # Nothing to do if the combined PDF is newer than all input PDFs
+    up_to_date, missing_bijlage_6 = combined_pdf_is_up_to_date(object_path, output_dir)
+    if up_to_date:
+        logger.info(f"Combined PDF is up-to-date for object [{object_code}], skipping")
+        return True, missing_bijlage_6
     
-    if not os.path.exists(output_dir):
-        logger.info(f"Creating output directory: [{output_dir}]")
-        os.makedirs(output_dir)
-    
-    # Find the PI report PDF (generated by this tooling)
-    # Exclude files with "compleet" in the name
-    pi_report_path = find_most_recent_file(object_path, PI_RAPPORT_PATTERN, exclude_pattern=EXCLUDE_COMPLEET)
+    os.makedirs(output_dir, exist_ok=True)
+    
+    # Find the PI report PDF (generated by this tooling) and the appendices in one pass.
+    # Exclude PI report files with "compleet" in the name (the combined output itself)
+    found = find_most_recent_files(object_path, {
+        "pi": PI_RAPPORT_PATTERN,
+        "b3": BIJLAGE_3_PATTERN,
+        "b6": BIJLAGE_6_PATTERN,
+        "b9": BIJLAGE_9_PATTERN,
+    }, excludes={"pi": EXCLUDE_COMPLEET})
+    pi_report_path = found["pi"]
     if not pi_report_path:
         logger.warning(f"PI report not found for object [{object_code}], skipping")
         return False, False
     
-    # Find Bijlage 3 (ORA report)
-    bijlage_3_path = find_most_recent_file(object_path, BIJLAGE_3_PATTERN)
-
-    # Find Bijlage 6 (Inspectietekeningen)
-    bijlage_6_path = find_most_recent_file(object_path, BIJLAGE_6_PATTERN)
+    # Bijlage 3 (ORA report), Bijlage 6 (Inspectietekeningen) and Bijlage 9 (Aandachtspunten beheerder)
+    bijlage_3_path = found["b3"]
+    bijlage_6_path = found["b6"]
+    bijlage_9_path = found["b9"]
     missing_bijlage_6 = bijlage_6_path is None
     if missing_bijlage_6:
         logger.warning(f"Bijlage 6 not found for object [{object_code}], will proceed without it")
-
-    # Find Bijlage 9 (Aandachtspunten beheerder)
-    bijlage_9_path = find_most_recent_file(object_path, BIJLAGE_9_PATTERN)
-    
-    # Skip if critical appendices are missing (3 and 9)
-    if not bijlage_3_path or not bijlage_9_path:
-        logger.warning(f"Critical appendices (3 or 9) missing for object [{object_code}], skipping")
-        return False, missing_bijlage_6
     
     # Create output filename
     pi_basename = os.path.basename(pi_report_path)
@@ -293,14 +705,24 @@ def process_object(object_path: str, object_code: str, config: dict, logger) ->
     output_filename = f"{pi_name} - compleet{pi_ext}"
     output_path = os.path.join(output_dir, output_filename)
 
+    # Skip if critical appendices are missing (3 and 9)
+    if not bijlage_3_path or not bijlage_9_path:
+        if os.path.exists(output_path):
+            logger.error(f"Critical appendices (3 or 9) missing for object [{object_code}], "
+                         f"existing combined PDF [{output_filename}] is not updated")
+        else:
+            logger.warning(f"Critical appendices (3 or 9) missing for object [{object_code}], skipping")
+        return False, missing_bijlage_6
     
-    # Check if combined PDF already exists
+    # An existing combined PDF is older than one of the inputs, so it is replaced
     if os.path.exists(output_path):
-        logger.info(f"Combined PDF already exists: [{output_filename}], skipping")
-        return True, missing_bijlage_6
+        logger.warning(f"Combined PDF is outdated: [{output_filename}], overwriting it")
     
     # Combine the PDFs
-    success = combine_pdfs(pi_report_path, bijlage_3_path, bijlage_6_path, bijlage_9_path, output_path)
+    # Fixed insertion points for templated PI reports skip the text search
+    insertion_overrides = config.get("insertion_points", {})
+    success = combine_pdfs(pi_report_path, bijlage_3_path, bijlage_6_path, bijlage_9_path, output_path,
+                           insertion_overrides)
     
     if success:
         logger.info(f"Successfully processed object [{object_code}]")
@@ -328,11 +750,22 @@ def main() -> None:
     successful_objects = []
     skipped_objects = []
     missing_bijlage_6_objects = []
-    
-    # Loop through all objects in the batch
-    for object_path, object_code in utils.get_object_paths_codes():
+
+    # Drop the cached insertion points of PI reports that no longer exist
+    prune_insertion_cache(INSERTION_CACHE_DIR)
+    
+    # The objects are independent, so they are combined in parallel worker processes
+    objects = list(utils.get_object_paths_codes())
+    with utils.worker_process_pool(utils.worker_count()) as executor:
+        futures = {
+            executor.submit(process_object, object_path, object_code, config, None): object_code
+            for object_path, object_code in objects
+        }
+
+    # Collect the results in the original order of the objects
+    for future, object_code in futures.items():
         try:
-            success, missing_bijlage_6 = process_object(object_path, object_code, config, logger)
+            success, missing_bijlage_6 = future.result()
             
             if missing_bijlage_6:
                 missing_bijlage_6_objects.append(object_code)
@@ -18,14 +18,20 @@ The script performs the following steps:
 5. Saves the document and converts it to a PDF.
 
 Functions:
+- `read_template`: Reads a Word template from disk, once per template.
 - `create_word_document`: Creates a Word document based on a template and variables.
+- `find_categorie_column`: Finds the category column in the ORA data.
 - `extract_relevant_data`: Filters the ORA data for relevant attention points.
-- `list_of_fotonummers`: Parses and processes photo numbers from the data.
+- `list_of_fotonummers`: Parses the photo numbers of all rows from the data.
+- `build_foto_index`: Normalizes the image filenames once for matching photo numbers.
 - `find_foto_path`: Finds the file path for a given photo number.
+- `prepare_thumbnail`: Downscales an image to the size it is displayed at in the document.
+- `load_picture`: Loads the (downscaled) image into memory, once per file.
 - `copy_last_table`: Duplicates the last table in the Word document.
 - `remove_last_table`: Removes the last table in the Word document.
 - `process_aandachtspunten_beheerder`: Populates the Word document with attention points.
 - `save_aandachtspunten_beheerder`: Saves the Word document to a specified location.
+- `process_object`: Generates the Word document for a single object.
 - `main`: Orchestrates the entire process, including error handling.
 
 Dependencies:
@@ -44,9 +50,11 @@ for all objects in the batch listed in config.
 # Built-in modules
 import copy
 import datetime as dt
+import functools
+import io
 import logging
 import os
-import time
+import re
 
 # External modules
 import docx
@@ -54,12 +62,13 @@ import pandas as pd
 from docx.enum.style import WD_STYLE_TYPE
 from docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT
 from docx.shared import Pt, RGBColor
+from PIL import Image, ImageOps
 
 # Local imports
 from IAK_Report.get_voortgang import get_voortgang, get_voortgang_params
 from IAK_Report.ora_to_word import load_inspectie_data, load_ora
 from IAK_Report.utils import (
-    convert_docx_to_pdf,
+    convert_docx_to_pdf_many,
     get_object_paths_codes,
     list_pictures_for_object,
     load_config,
@@ -67,8 +76,39 @@ from IAK_Report.utils import (
     save_document,
     setup_logger,
     update_config_with_voortgang,
+    worker_count,
+    worker_process_pool,
 )
 
+# Text containing both "aandachtspunt" and "beheerder" (in any order, case-insensitive)
+AANDACHTSPUNT_BEHEERDER_PATTERN = re.compile(
+    r"aandachtspunt.*beheerder|beheerder.*aandachtspunt", re.IGNORECASE | re.DOTALL
+)
+
+# Photo numbers in a cell are separated by commas or semicolons
+FOTO_SEPARATOR_PATTERN = re.compile(r"[,;]")
+
+# The photos are shown about 6.5 cm wide (2350000 EMU); 900 pixels is still sharp at that size
+FOTO_WIDTH_EMU = 2350000
+THUMBNAIL_MAX_PX = 900
+THUMBNAIL_JPEG_QUALITY = 82
+
+
+@functools.lru_cache(maxsize=8)
+def read_template(template_path: str) -> bytes:
+    """
+    Reads a Word template from disk. The templates do not change during a batch,
+    so each template is read only once per process and reused for every object.
+
+    Parameters:
+        template_path (str): Path to the Word template.
+
+    Returns:
+        bytes: The contents of the template file.
+    """
+    with open(template_path, "rb") as template_file:
+        return template_file.read()
+
 
 def create_word_document(template_path: str, variables: dict) -> docx.Document:
     """
@@ -97,7 +137,7 @@ def create_word_document(template_path: str, variables: dict) -> docx.Document:
         object_naam,
     )
 
-    document = docx.Document(template_path)
+    document = docx.Document(io.BytesIO(read_template(template_path)))
     styles = document.styles
 
     # Configure footer style
@@ -139,13 +179,32 @@ def create_word_document(template_path: str, variables: dict) -> docx.Document:
     return document
 
 
-def extract_relevant_data(ORA: pd.DataFrame) -> pd.DataFrame:
+def find_categorie_column(ORA: pd.DataFrame) -> str:
+    """
+    Finds the column with the category of the measures: the first column starting with
+    "Categorie", or "Advies mutatie I-ORA & Onderhoud" in older ORA sheets.
+
+    Args:
+        ORA (pd.DataFrame): The ORA data.
+
+    Returns:
+        str: The name of the category column.
+    """
+    return next(
+        (column for column in ORA.columns if column.startswith("Categorie")),
+        "Advies mutatie I-ORA & Onderhoud",
+    )
+
+
+def extract_relevant_data(ORA: pd.DataFrame, select_column: str = None) -> pd.DataFrame:
     """
     Filters the input DataFrame to extract rows where the column
     "Advies mutatie I-ORA & Onderhoud" contains both "aandachtspunt" and "beheerder" (case-insensitive).
 
     Args:
         ORA (pd.DataFrame): The input DataFrame containing the data to filter.
+        select_column (str): The category column to filter on. If None, it is
+            looked up with `find_categorie_column`.
 
     Returns:
         pd.DataFrame: A filtered DataFrame containing only the rows
@@ -154,51 +213,40 @@ def extract_relevant_data(ORA: pd.DataFrame) -> pd.DataFrame:
     logging.info(
         "Filtering ORA DataFrame for rows containing 'aandachtspunt' and 'beheerder' (case-insensitive)."
     )
-    relevant_columns = [column for column in ORA.columns if column.startswith("Categorie")]
-    select_column = relevant_columns[0] if relevant_columns else "Advies mutatie I-ORA & Onderhoud"
-    return ORA[
-        ORA[select_column].str.contains("aandachtspunt", case=False, na=False)
-        & ORA[select_column].str.contains("beheerder", case=False, na=False)
-    ]
+    if select_column is None:
+        select_column = find_categorie_column(ORA)
+    return ORA[ORA[select_column].str.contains(AANDACHTSPUNT_BEHEERDER_PATTERN, na=False)]
 
 
-def list_of_fotonummers(fotonummers: str) -> list:
+def list_of_fotonummers(fotonummers: pd.Series) -> pd.Series:
     """
-    Converts a cell value from a pandas Series containing photo numbers into a list of photo numbers.
+    Converts a column of cells containing photo numbers into a list of photo numbers per cell,
+    in one vectorized pass over the column.
 
-    This function processes a string representation of photo numbers, which may be:
-    - A comma-separated string of photo numbers.
+    Each cell may contain:
+    - A comma- or semicolon-separated string of photo numbers.
     - A single photo number.
-    - The string "nan" (interpreted as no photo numbers).
+    - Nothing ("nan", interpreted as no photo numbers).
 
     Args:
-        fotonummers (str): A cell value from a pandas Series, expected to be a string representation of photo numbers.
+        fotonummers (pd.Series): Column with the photo numbers per row.
 
     Returns:
-        list: A list of photo numbers as strings. Returns an empty list if the input is "nan".
-
-    Debug Logging:
-        Logs the input value and the resulting list for debugging purposes.
-    """
-
-    logging.debug("Processing fotonummers: %s", fotonummers)
-    fotonummers = str(fotonummers)
-    # Check if ',' exists in the string and split accordingly
-    if "," in fotonummers:
-        # Split the string into a list of substrings and strip each element
-        fotonummers_list = [item.strip() for item in fotonummers.split(",")]
-    elif ";" in fotonummers:
-        # Split the string into a list of substrings and strip each element
-        fotonummers_list = [item.strip() for item in fotonummers.split(";")]
-    elif fotonummers.strip() == "nan":
-        logging.debug("Input is 'nan', returning an empty list.")
-        return []
-    else:
-        # Otherwise, just create a list with a single stripped element
-        fotonummers_list = [fotonummers.strip()]
-
-    logging.debug("Resulting list of fotonummers: %s", fotonummers_list)
-    return fotonummers_list  # list of photo numbers as strings (filename)
+        pd.Series: A list of photo numbers as strings per row (filenames).
+        The list is empty if the cell has no photo numbers.
+    """
+    # Building the lists for the debug messages is only worth it if they are logged
+    debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+    if debug_enabled:
+        logging.debug("Processing fotonummers: %s", fotonummers.tolist())
+    split_fotonummers = fotonummers.fillna("").astype(str).str.split(FOTO_SEPARATOR_PATTERN)
+    # Each item is stripped once, in the same pass that drops the empty ones
+    fotonummers_lists = split_fotonummers.map(
+        lambda items: [item for item in map(str.strip, items) if item and item != "nan"]
+    )
+    if debug_enabled:
+        logging.debug("Resulting lists of fotonummers: %s", fotonummers_lists.tolist())
+    return fotonummers_lists
 
 
 def _normalize_filename(filename: str) -> str:
@@ -214,21 +262,46 @@ def _normalize_filename(filename: str) -> str:
     return "".join(c for c in filename.lower() if c.isalnum())
 
 
-def find_foto_path(fotonummer: str, imgs: list) -> str:
+def build_foto_index(imgs: list) -> dict:
+    """
+    Normalizes the filenames of all available images once, and indexes them by every
+    ending of the normalized name. A photo number matches the images whose name ends
+    with it, so finding the matches is a single dictionary lookup. The empty ending
+    lists every image once; photo numbers are never empty.
+
+    Args:
+        imgs (list): The list of fullfilenames of all available images.
+
+    Returns:
+        dict: Ending of a normalized name without extension -> list of tuples
+        (normalized name, fullfilename) of the images whose name ends with it.
+    """
+    foto_index = {}
+    for fullfilename in imgs:
+        name_normalized = _normalize_filename(os.path.splitext(os.path.basename(fullfilename))[0])
+        for start in range(len(name_normalized) + 1):
+            foto_index.setdefault(name_normalized[start:], []).append((name_normalized, fullfilename))
+    return foto_index
+
+
+def find_foto_path(fotonummer: str, foto_index: dict, foto_sizes: dict = None) -> str:
     """
     Finds the file path of an image based on a given photo number.
 
-    This function searches through the list of files in the specified directory
-    and returns the full path of the first image file that contains the given
-    photo number in its name. Both the photo number and image filenames are
-    normalized (lowercase, alphanumeric only) for flexible matching.
+    This function searches through the index of available images and returns
+    the full path of the image file that contains the given photo number in its
+    name. Both the photo number and image filenames are normalized (lowercase,
+    alphanumeric only) for flexible matching. The name must end with the photo
+    number; an image named exactly after the photo number takes precedence.
 
     If multiple images match the photo number, the smallest file (compressed version)
     is returned.
 
     Args:
         fotonummer (str): The photo number to search for in the image filenames.
-        imgs (list): The list of fullfilenames of all available images.
+        foto_index (dict): Index of all available images, see `build_foto_index`.
+        foto_sizes (dict): Optional cache of file sizes by path, filled on use, so each
+            image is measured only once per object.
 
     Returns:
         str: The full file path of the matching image (smallest if multiple found),
@@ -256,21 +329,18 @@ def find_foto_path(fotonummer: str, imgs: list) -> str:
     if not fotonummer_normalized:
         raise ValueError(f"Photo number [{original_fotonummer}] is empty after normalization.")
 
-    # Collect all matching images
-    matching_images = []
-
-    for fullfilename in imgs:
-        # Extract filename without extension and normalize it
-        filename = os.path.basename(fullfilename)
-        name_without_ext = os.path.splitext(filename)[0]
-        name_normalized = _normalize_filename(name_without_ext)
-
-        # Match if filename ends with photo number (handles cases like "9252" matching "DSCN9252")
-        if name_normalized.endswith(fotonummer_normalized):
-            matching_images.append(fullfilename)
+    # Match if filename ends with photo number (handles cases like "9252" matching "DSCN9252"),
+    # images named exactly after the photo number take precedence
+    candidates = foto_index.get(fotonummer_normalized, [])
+    matching_images = [
+        fullfilename
+        for name_normalized, fullfilename in candidates
+        if name_normalized == fotonummer_normalized
+    ] or [fullfilename for _, fullfilename in candidates]
 
     # Handle no matches
     if not matching_images:
+        imgs = [fullfilename for _, fullfilename in foto_index.get("", [])]
         common_path = os.path.commonpath(imgs) if imgs else "unknown path"
         raise FileNotFoundError(
             f"Image with photo number [{original_fotonummer}] (normalized: '{fotonummer_normalized}') "
@@ -279,39 +349,98 @@ def find_foto_path(fotonummer: str, imgs: list) -> str:
 
     # Return smallest file if multiple matches (compressed version)
     if len(matching_images) > 1:
-        smallest_image = min(matching_images, key=os.path.getsize)
+        if foto_sizes is None:
+            foto_sizes = {}
+        for fullfilename in matching_images:
+            if fullfilename not in foto_sizes:
+                foto_sizes[fullfilename] = os.path.getsize(fullfilename)
+        smallest_image = min(matching_images, key=foto_sizes.__getitem__)
         logging.debug(
-            f"Found {len(matching_images)} photos for '{original_fotonummer}', "
-            f"using smallest: {os.path.basename(smallest_image)}"
+            "Found %d photos for '%s', using smallest: %s",
+            len(matching_images),
+            original_fotonummer,
+            os.path.basename(smallest_image),
         )
         return smallest_image
 
     # Single match found
     logging.debug(
-        f"Found photo for '{original_fotonummer}': {os.path.basename(matching_images[0])}"
+        "Found photo for '%s': %s", original_fotonummer, os.path.basename(matching_images[0])
     )
     return matching_images[0]
 
 
-def copy_last_table(word_document: docx.Document) -> None:
+# The photos belong to one object; only a photo referenced by several points of attention
+# in the same document is reused, so a small cache suffices
+@functools.lru_cache(maxsize=16)
+def prepare_thumbnail(path_foto: str, mtime_ns: int) -> bytes:
+    """
+    Downscales an image to at most THUMBNAIL_MAX_PX pixels wide and high, as JPEG.
+
+    Word embeds the full image file, even though the photos are displayed small. Photos
+    from the inspection are often several MB each; the thumbnail keeps the document
+    (and the PDF made from it) small. Images that are already small enough are used as is.
+
+    Args:
+        path_foto (str): The full path of the image.
+        mtime_ns (int): Modification time of the image, so a changed file is read again.
+
+    Returns:
+        bytes: The image contents.
+    """
+    with Image.open(path_foto) as img:
+        if max(img.size) <= THUMBNAIL_MAX_PX:
+            with open(path_foto, "rb") as foto_file:
+                return foto_file.read()
+        # Apply the EXIF orientation, which is lost when saving
+        thumbnail = ImageOps.exif_transpose(img)
+        thumbnail.thumbnail((THUMBNAIL_MAX_PX, THUMBNAIL_MAX_PX))
+        if thumbnail.has_transparency_data:
+            # JPEG has no transparency, show transparent parts on white instead of black
+            thumbnail = Image.alpha_composite(
+                Image.new("RGBA", thumbnail.size, "white"), thumbnail.convert("RGBA")
+            )
+        buffer = io.BytesIO()
+        thumbnail.convert("RGB").save(buffer, "JPEG", quality=THUMBNAIL_JPEG_QUALITY, optimize=True)
+    return buffer.getvalue()
+
+
+def load_picture(path_foto: str) -> io.BytesIO:
+    """
+    Loads an image into memory, downscaled for the document. Each file is only read once.
+
+    Args:
+        path_foto (str): The full path of the image.
+
+    Returns:
+        io.BytesIO: An in-memory stream of the image, to pass to `add_picture`.
+    """
+    return io.BytesIO(prepare_thumbnail(path_foto, os.stat(path_foto).st_mtime_ns))
+
+
+def copy_last_table(word_document: docx.Document, count: int = 1) -> None:
     """
     Duplicates the last table in the Word document.
 
     This function takes the last table in the provided Word template document,
-    creates a deep copy of it, and appends the copied table to the document.
+    and appends `count` deep copies of it to the document. The template table is
+    looked up once, so adding many copies stays linear in the number of copies.
 
     Args:
         word_document (docx.Document): The Word document object where the table will be duplicated.
+        count (int): Number of copies to append.
 
     Returns:
         None
     """
     # logging.debug("Copying the last table in the Word document.")
-    template = word_document.tables[-1]
-    tbl = template._tbl
-    new_tbl = copy.deepcopy(tbl)
-    paragraph = word_document.add_paragraph()
-    paragraph._p.addnext(new_tbl)
+    tbl = word_document.tables[-1]._tbl
+    for _ in range(count):
+        # lxml implements deepcopy in C; it is faster than a tostring/parse_xml round trip
+        new_tbl = copy.deepcopy(tbl)
+        # The paragraph keeps the tables apart, adjacent tables are merged by Word
+        paragraph = word_document.add_paragraph()
+        paragraph._p.addnext(new_tbl)
     # logging.debug("Successfully copied and appended the last table.")
 
 
@@ -338,7 +467,10 @@ def remove_last_table(word_document: docx.Document) -> None:
 
 
 def process_aandachtspunten_beheerder(
-    word_document: docx.Document, ora_filtered: pd.DataFrame, path_imgs: list
+    word_document: docx.Document,
+    ora_filtered: pd.DataFrame,
+    path_imgs: list,
+    foto_sizes: dict = None,
 ) -> docx.Document:
     """
     Processes the aandachtspunten beheerder and populates the Word document with relevant data.
@@ -347,6 +479,8 @@ def process_aandachtspunten_beheerder(
         word_document (docx.Document): The Word document to populate.
         ora_filtered (pd.DataFrame): Filtered ORA data containing aandachtspunten.
         path_imgs (list): Filenames of all pictures for the object.
+        foto_sizes (dict): Optional file sizes of the pictures by path, e.g. from
+            `list_pictures_for_object`. Missing sizes are looked up when needed.
 
     Returns:
         docx.Document: The updated Word document.
@@ -354,98 +488,124 @@ def process_aandachtspunten_beheerder(
     logging.info("Starting to process aandachtspunten beheerder.")
     cell_style = word_document.styles["Paragraph"]
 
-    # Duplicate tables based on the number of aandachtspunten
+    # Without aandachtspunten the "Geen aandachtspunten" template is used instead
+    if ora_filtered.empty:
+        logging.info("No aandachtspunten beheerder to process.")
+        return word_document
+
+    # Match the number of tables to the number of aandachtspunten: one table each.
+    # The template does not depend on a fixed number of tables this way.
     logging.debug("Duplicating tables for aandachtspunten.")
-    if len(ora_filtered) == 1:
+    missing_tables = len(ora_filtered) - len(word_document.tables)
+    if missing_tables > 0:
+        copy_last_table(word_document, missing_tables)
+        logging.info(f"Duplicated tables for {len(ora_filtered)} aandachtspunten.")
+    for _ in range(-missing_tables):
         remove_last_table(word_document)
-        logging.info("Removed the last table for a single aandachtspunt.")
-    else:
-        for _ in range(len(ora_filtered) - 2):
-            copy_last_table(word_document)
-        logging.info(f"Duplicated tables for {len(ora_filtered) - 1} aandachtspunten.")
-
-    # sort ora_filtered based on "Bevinding" column, only the code before the colon,
-    # which is the attention point number
-    ora_filtered["Aandachtspunt_nummer"] = ora_filtered["Bevinding"].apply(
-        lambda x: x.split(":")[0].strip()[-2:] if isinstance(x, str) and ":" in x else ""
-    )
+        logging.info("Removed a table not needed for the aandachtspunten.")
+
+    # Split the "Bevinding" column of all rows at the first colon at once:
+    # everything in front of the colon is the attention point, everything after it is the observation.
+    # Sometimes the attention point has an introduction-sentence, so we take only the two characters
+    # before the colon, which is the attention point number.
+    bevinding_parts = ora_filtered["Bevinding"].astype(str).str.partition(":")
+    has_colon = bevinding_parts[1] == ":"
+    ora_filtered["Aandachtspunt_nummer"] = bevinding_parts[0].str.strip().str[-2:].where(has_colon, "")
+    ora_filtered["Bevinding_ora"] = bevinding_parts[2].str.strip()
+
+    # sort ora_filtered based on the attention point number
     ora_filtered.sort_values("Aandachtspunt_nummer", inplace=True)
 
-    # Populate each table with data
-    for i, (idx, row) in enumerate(ora_filtered.iterrows()):
-        # logging.debug("Processing row %d: %s", idx, row.to_dict())
+    if not has_colon.all():
+        cell_content = ora_filtered.loc[~has_colon, "Bevinding"].iloc[0]
+        raise ValueError(
+            f"Cell content does not contain ':': {cell_content}. "
+            "Please check the ORA sheet for correct formatting."
+        )
 
-        cell_content = row["Bevinding"]
-        if not ":" in cell_content:
-            raise ValueError(
-                f"Cell content does not contain ':': {cell_content}. "
-                "Please check the ORA sheet for correct formatting."
-            )
+    # Normalize the image filenames once for all photo numbers
+    foto_index = build_foto_index(path_imgs)
+    if foto_sizes is None:
+        foto_sizes = {}
 
-        # Everything in front of the colon is the attention point
-        aandachtspunt = cell_content.partition(":")[0].strip()
-        # However, sometimes it has an introduction-sentence, so we take only the two characters before
-        # the colon, which is the attention point number.
-        if len(aandachtspunt) > 2:
-            aandachtspunt = aandachtspunt[-2:]
+    # Parse the photo numbers of all rows at once
+    foto_column = [column for column in ora_filtered.columns if "Foto" in column][0]
+    fotos_per_row = list_of_fotonummers(ora_filtered[foto_column])
 
-        # Everything after the colon is the observation
-        bevinding_ora = cell_content.partition(":")[2].strip()
+    # we want to get the aandachtspunt written in "MaatregelNaam" column instead of the "Categorie" column.
+    # The columns are the same for every row, so the column is selected once.
+    relevant_columns = [
+        column for column in ora_filtered.columns if column.startswith("MaatregelNaam")
+    ]
+    select_column = relevant_columns[0] if relevant_columns else "Advies mutatie I-ORA & Onderhoud"
+
+    # Populate each table with data, iterating over the plain column values instead of a Series per row
+    rows = zip(
+        ora_filtered["Aandachtspunt_nummer"].to_numpy(),
+        ora_filtered["Bevinding_ora"].to_numpy(),
+        ora_filtered["Element"].to_numpy(),
+        ora_filtered["Bouwdeel"].to_numpy(),
+        ora_filtered[select_column].to_numpy(),
+        fotos_per_row.to_numpy(),
+    )
+    align_top = WD_CELL_VERTICAL_ALIGNMENT.TOP
 
+    # word_document.tables searches the whole document body on every access, so it is read once
+    tables = word_document.tables
+    for i, (aandachtspunt, bevinding_ora, element_ora, bouwdeel_ora, maatregel, fotos) in enumerate(rows):
         # Extract photo numbers and their paths
-        foto_column = [column for column, value in row.items() if "Foto" in column][0]
-        fotos = list_of_fotonummers(row[foto_column])
         foto1 = fotos[0] if fotos else None
         foto2 = fotos[1] if len(fotos) > 1 else None
-        path_foto1 = find_foto_path(foto1, path_imgs) if foto1 else None
-        path_foto2 = find_foto_path(foto2, path_imgs) if foto2 else None
+        path_foto1 = find_foto_path(foto1, foto_index, foto_sizes) if foto1 else None
+        path_foto2 = find_foto_path(foto2, foto_index, foto_sizes) if foto2 else None
 
-        logging.info(f"Aandachtspunt: {aandachtspunt}, Foto1: {foto1}, Foto2: {foto2}")
+        logging.info("Aandachtspunt: %s, Foto1: %s, Foto2: %s", aandachtspunt, foto1, foto2)
 
         # strip element and bouwdeel such that (+) and (Kopie) are removed,
         # and only the first part of the element is taken (before the comma)
-        element = row["Element"].partition(",")[0].replace("(+)", "").replace("(Kopie)", "").strip()
-        bouwdeel = row["Bouwdeel"].replace("(+)", "").replace("(Kopie)", "").strip()
-
-        word_document.tables[i].cell(0, 0).text = str("Aandachtspunt " + aandachtspunt)
-        word_document.tables[i].cell(0, 0).paragraphs[0].style = cell_style
-        word_document.tables[i].cell(1, 1).text = str(element)
-        word_document.tables[i].cell(1, 1).paragraphs[0].style = cell_style
-        word_document.tables[i].cell(2, 1).text = str(bouwdeel)
-        word_document.tables[i].cell(2, 1).paragraphs[0].style = cell_style
-        word_document.tables[i].cell(4, 0).text = str(bevinding_ora)
-        word_document.tables[i].cell(4, 0).paragraphs[0].style = cell_style
-        word_document.tables[i].cell(4, 0).vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.TOP
-
-        # we want to get the aandachtspunt written in "MaatregelNaam" column instead of the "Categorie" column.
-        # sometimes, this column is empty, then the user needs to fill in the correct value in the Excel.
-        relevant_columns = [
-            column for column, value in row.items() if column.startswith("MaatregelNaam")
-        ]
-        select_column = (
-            relevant_columns[0] if relevant_columns else "Advies mutatie I-ORA & Onderhoud"
-        )
-        if str(row[select_column]) == "nan":
-            word_document.tables[i].cell(
-                6, 0
-            ).text = "Geen 'MaatregelNaam' ingevuld (kolom AJ in 'Inspectie Data' sheet)"
+        element = element_ora.partition(",")[0].replace("(+)", "").replace("(Kopie)", "").strip()
+        bouwdeel = bouwdeel_ora.replace("(+)", "").replace("(Kopie)", "").strip()
+
+        # table.cell() rebuilds the list of all cells on every call, so the list is built once per
+        # table and indexed the same way: row * column count + column
+        table = tables[i]
+        cells = table._cells
+        column_count = table._column_count
+        cell = cells[0]
+        cell.text = str("Aandachtspunt " + aandachtspunt)
+        cell.paragraphs[0].style = cell_style
+        cell = cells[1 * column_count + 1]
+        cell.text = str(element)
+        cell.paragraphs[0].style = cell_style
+        cell = cells[2 * column_count + 1]
+        cell.text = str(bouwdeel)
+        cell.paragraphs[0].style = cell_style
+        cell = cells[4 * column_count + 0]
+        cell.text = str(bevinding_ora)
+        cell.paragraphs[0].style = cell_style
+        cell.vertical_alignment = align_top
+
+        # sometimes, the "MaatregelNaam" column is empty, then the user needs to fill in the correct value in the Excel.
+        cell = cells[6 * column_count + 0]
+        if str(maatregel) == "nan":
+            cell.text = "Geen 'MaatregelNaam' ingevuld (kolom AJ in 'Inspectie Data' sheet)"
         else:
-            word_document.tables[i].cell(6, 0).text = str(row[select_column])
-        word_document.tables[i].cell(6, 0).paragraphs[0].style = cell_style
-        word_document.tables[i].cell(6, 0).vertical_alignment = WD_CELL_VERTICAL_ALIGNMENT.TOP
+            cell.text = str(maatregel)
+        cell.paragraphs[0].style = cell_style
+        cell.vertical_alignment = align_top
 
         if foto1:
-            logging.debug(f"Adding Foto1 to table {i}.")
-            word_document.tables[i].cell(4, 2).paragraphs[0].add_run().add_picture(
-                path_foto1, width=2350000
+            logging.debug("Adding Foto1 to table %d.", i)
+            cells[4 * column_count + 2].paragraphs[0].add_run().add_picture(
+                load_picture(path_foto1), width=FOTO_WIDTH_EMU
             )
         if foto2:
-            logging.debug(f"Adding Foto2 to table {i}.")
+            logging.debug("Adding Foto2 to table %d.", i)
             # TO DO: add an return between the two photos
-            word_document.tables[i].cell(6, 2).paragraphs[0].add_run().add_picture(
-                path_foto2, width=2350000
+            cells[6 * column_count + 2].paragraphs[0].add_run().add_picture(
+                load_picture(path_foto2), width=FOTO_WIDTH_EMU
             )
-        logging.info(f"Processed single aandachtspunt {i + 1}.")
+        logging.info("Processed single aandachtspunt %d.", i + 1)
     logging.info("Finished processing aandachtspunten beheerder.")
     return word_document
 
@@ -472,6 +632,47 @@ def save_aandachtspunten_beheerder(document: docx.Document, save_dir: str, objec
     return os.path.join(save_dir, file_name)
 
 
+def process_object(
+    object_path: str, object_code: str, variables: dict, template_word: str, template_word_geen: str
+) -> str:
+    """
+    Generates the Word document (Bijlage 9 - Aandachtspunten Beheerder) for a single object.
+    The objects are independent, so this runs in a worker process.
+
+    Args:
+        object_path (str): Path to the object directory.
+        object_code (str): Code of the object.
+        variables (dict): Configuration variables, updated with the voortgang of the object.
+        template_word (str): Path to the Word template with aandachtspunten.
+        template_word_geen (str): Path to the Word template without aandachtspunten.
+
+    Returns:
+        str: The full path of the saved document.
+    """
+    save_dir = os.path.join(object_path, variables.get("output_folder", ""))
+    path_ora = return_most_recent_ora(object_path)
+    print("Checking for images...")
+    foto_sizes = {}
+    path_imgs = list_pictures_for_object(object_path, sizes=foto_sizes)
+    inspectie_data = load_inspectie_data(path_ora)
+    categorie_column = find_categorie_column(inspectie_data)
+    logging.debug("Category column: %s", categorie_column)
+    ora_filtered = extract_relevant_data(inspectie_data, categorie_column)
+    logging.info(f"The number of aandachtspunten voor beheerder is: {len(ora_filtered)}")
+
+    if len(ora_filtered) == 0:
+        logging.info("Making the word document with no aandachtspunten...")
+        word_document = create_word_document(template_word_geen, variables)
+    else:
+        logging.info("Making the word document with aandachtspunten...")
+        word_document = create_word_document(template_word, variables)
+        word_document = process_aandachtspunten_beheerder(
+            word_document, ora_filtered, path_imgs, foto_sizes
+        )
+
+    return save_aandachtspunten_beheerder(word_document, save_dir, object_code)
+
+
 def main():
     """
     Main function to orchestrate the processing of the PI report.
@@ -513,39 +714,44 @@ def main():
     list_of_object_codes = get_object_paths_codes(config_file=config_path)
     failed_objects = []
 
-    for object_path, object_code in list_of_object_codes:
-        logger.info(f"Processing object path: {object_path}, object code: {object_code}")
+    # The Word documents are generated in parallel worker processes. The conversion to PDF
+    # drives Word (single instance), so it runs afterwards in this process, in one Word session.
+    with worker_process_pool(worker_count(reserve=1)) as executor:
+        futures = {}
+        for object_path, object_code in list_of_object_codes:
+            logger.info(f"Processing object path: {object_path}, object code: {object_code}")
+
+            # The voortgang updates of the configuration build on each other, so they are done
+            # here in order; every object gets a snapshot of the configuration for its document
+            voortgang = get_voortgang_params(df_voortgang=df_voortgang, bh_code=object_code)
+            config = update_config_with_voortgang(config, voortgang)
+            future = executor.submit(
+                process_object, object_path, object_code, dict(config), TEMPLATE_WORD, TEMPLATE_WORD_GEEN
+            )
+            futures[future] = object_code
 
-        voortgang = get_voortgang_params(df_voortgang=df_voortgang, bh_code=object_code)
-        variables = update_config_with_voortgang(config, voortgang)
-        save_dir = os.path.join(object_path, config.get("output_folder", ""))
+    # Collect the documents in the original order of the objects
+    pdf_jobs = []
+    for future, object_code in futures.items():
         try:
-            path_ora = return_most_recent_ora(object_path)
-            print("Checking for images...")
-            path_imgs = list_pictures_for_object(object_path)
-            inspectie_data = load_inspectie_data(path_ora)
-            ora_filtered = extract_relevant_data(inspectie_data)
-            logger.info(f"The number of aandachtspunten voor beheerder is: {len(ora_filtered)}")
-
-            if len(ora_filtered) == 0:
-                logger.info("Making the word document with no aandachtspunten...")
-                word_document = create_word_document(TEMPLATE_WORD_GEEN, variables)
-            else:
-                logger.info("Making the word document with aandachtspunten...")
-                word_document = create_word_document(TEMPLATE_WORD, variables)
-                word_document = process_aandachtspunten_beheerder(
-                    word_document, ora_filtered, path_imgs
-                )
-
-            document_path = save_aandachtspunten_beheerder(word_document, save_dir, object_code)
+            document_path = future.result()
             logging.info(f"Word document saved successfully at: {document_path}")
-            time.sleep(1)
-            pdf_document_path = convert_docx_to_pdf(document_path)
-            logging.info(f"PDF document for object code: {object_code} at [{pdf_document_path}]")
+            pdf_jobs.append((document_path, object_code))
         except Exception as e:
             failed_objects.append(object_code)
             logging.error(f"Failed to generate for object code: {object_code}. Error: {e}")
 
+    # Convert all documents to PDF in a single Word session
+    # Document.save writes the files synchronously, so they can be converted right away
+    if pdf_jobs:
+        pdf_document_paths = convert_docx_to_pdf_many([document_path for document_path, _ in pdf_jobs])
+        for (_, object_code), pdf_document_path in zip(pdf_jobs, pdf_document_paths):
+            if pdf_document_path is None:
+                failed_objects.append(object_code)
+                logging.error(f"Failed to convert to PDF for object code: {object_code}.")
+            else:
+                logging.info(f"PDF document for object code: {object_code} at [{pdf_document_path}]")
+
     if failed_objects:
         logger.error(f"Failed to process the following objects: {failed_objects}")
     else:
@@ -17,6 +17,8 @@ The script performs the following steps:
 
 Functions:
 - `file_starts_with_bijlage3`: Checks if any file in a directory starts with "Bijlage 3".
+- `find_ora_export`: Finds the ORA file, its sheet and the PDF name for one object.
+- `export_bijlage3_pdfs`: Exports the PDFs of several objects in one Excel instance.
 - `run_macro_on_workbook`: Executes a macro to generate a PDF from an Excel workbook.
 
 Dependencies:
@@ -37,6 +39,9 @@ import os
 # Local imports
 from IAK_Report import utils, utilsxls
 
+# Each export worker process starts its own Excel instance; more instances mostly compete for memory
+MAX_EXCEL_INSTANCES = 4
+
 
 def file_starts_with_bijlage3(directory: str) -> str | None:
     """
@@ -50,19 +55,81 @@ def file_starts_with_bijlage3(directory: str) -> str | None:
         or None if no such file exists.
     """
 
-    # Check if any file in the (sub)directory starts with "Bijlage 3"
-    for root, _, files in os.walk(directory):
+    # Check if any file in the (sub)directory starts with "Bijlage 3".
+    # os.scandir returns the names without a stat call per file; only a matching name is checked further.
+    stack = [directory]
+    while stack:
+        root = stack.pop()
         logging.debug(f"Checking directory: [{root}]")
-        for file in files:
-            if file.startswith("Bijlage 3"):
-                full_path = os.path.join(root, file)
-                logging.info(f"Found file: [{file}]")
-                return full_path  # Return the full path of the first found file
+        try:
+            entries = os.scandir(root)
+        except OSError:
+            # Same as os.walk: skip directories that cannot be listed
+            continue
+        with entries:
+            subdirectories = []
+            for entry in entries:
+                if entry.name.startswith("Bijlage 3") and entry.is_file():
+                    logging.info(f"Found file: [{entry.name}]")
+                    return entry.path  # Return the full path of the first found file
+                if entry.is_dir(follow_symlinks=False):
+                    subdirectories.append(entry.path)
+        # Visit the subdirectories in listing order, like os.walk
+        stack.extend(reversed(subdirectories))
 
     logging.info("No file starting with 'Bijlage 3' found in object directory.")
     return None
 
 
+def find_ora_export(object_path: str, output_folder: str) -> tuple[str, str | None, str]:
+    """
+    Find the ORA file of an object and determine what to export to the Bijlage 3 PDF.
+
+    Args:
+        object_path (str): The path to the object directory.
+        output_folder (str): The output folder, relative to the object directory.
+
+    Returns:
+        tuple: (ora_path, ora_sheetname, pdf_filename)
+    """
+    logging.info("Checking if ORA exists...")
+    ora_path = utils.return_most_recent_ora(object_path)
+    logging.info(f"ORA found: {ora_path}")
+    # Find the relevant ora sheet name
+    ora_sheetname = utilsxls.find_ora_sheet_name(ora_path)
+
+    # Defining the name (with "Bijlage 3" and ".pdf")
+    filename, ext = os.path.splitext(os.path.basename(ora_path))
+    pdf_filename = os.path.join(
+        object_path,
+        output_folder,
+        f"Bijlage 3 - {filename}.pdf",
+    )
+    return ora_path, ora_sheetname, pdf_filename
+
+
+def export_bijlage3_pdfs(jobs: list) -> list:
+    """
+    Export the Bijlage 3 PDFs of several objects, in a new Excel instance of its own.
+    Excel is driven over COM, so this runs in a worker process next to the other instances.
+
+    Args:
+        jobs (list): Tuples (object_code, ora_path, ora_sheetname, pdf_filename).
+
+    Returns:
+        list: Tuples (object_code, error) per job, error is None if the export succeeded.
+    """
+    results = []
+    with utilsxls.ExcelSession(new_instance=True) as excel:
+        for object_code, ora_path, ora_sheetname, pdf_filename in jobs:
+            try:
+                excel.export_to_pdf(ora_path, pdf_filename, sheet_name=ora_sheetname)
+                results.append((object_code, None))
+            except Exception as e:
+                results.append((object_code, str(e)))
+    return results
+
+
 if __name__ == "__main__":
     # Generate timestamped log filename
     timestamp = dt.datetime.now().strftime("%Y%m%d-%H%M%S")
@@ -73,33 +140,46 @@ if __name__ == "__main__":
     logging.info("Starting the script to generate Bijlage 3...")
     config = utils.load_config(config_path="./config.json")
 
-    for object_path, object_code in utils.get_object_paths_codes():
-        logging.info(f"Processing object path: {object_path}, object code: {object_code}")
-        try:
-            # bijlage_3 = file_starts_with_bijlage3(object_path)
-            # if not bijlage_3:
-            logging.info(f"Generating ORA for object [{object_code}]...")
-            logging.info("Checking if ORA exists...")
-            ora_path = utils.return_most_recent_ora(object_path)
-            logging.info(f"ORA found: {ora_path}")
-            # Find the relevant ora sheet name
-            ora_sheetname = utilsxls.find_ora_sheet_name(ora_path)
-
-            logging.info("Generating the PDF...")
-
-            # Defining the name (with "Bijlage 3" and ".pdf")
-            filename, ext = os.path.splitext(os.path.basename(ora_path))
-            pdf_filename = os.path.join(
+    # Finding the ORA files (directory walks and reading the sheet names) is independent per
+    # object, so it runs in parallel worker processes
+    objects = list(utils.get_object_paths_codes())
+    with utils.worker_process_pool(utils.worker_count()) as executor:
+        futures = {
+            executor.submit(find_ora_export, object_path, config.get("output_folder", "")): (
                 object_path,
-                config.get("output_folder", ""),
-                f"Bijlage 3 - {filename}.pdf",
+                object_code,
             )
-            utilsxls.export_to_pdf(ora_path, pdf_filename, sheet_name=ora_sheetname)
-            logging.info(f"Successfully generated ORA for object [{object_code}].")
-            # else:
-            #    logging.info(f"ORA for object [{object_code}] already exists with name [{bijlage_3}].")
+            for object_path, object_code in objects
+        }
+
+    jobs = []
+    for future, (object_path, object_code) in futures.items():
+        logging.info(f"Processing object path: {object_path}, object code: {object_code}")
+        try:
+            ora_path, ora_sheetname, pdf_filename = future.result()
+            jobs.append((object_code, ora_path, ora_sheetname, pdf_filename))
         except Exception as e:
             logging.error(f"An error occurred: {e}")
-            logging.error("Failed to generate ORA for object [{object_code}].")
-            continue  # Continue to the next object in case of an error
-            continue  # Continue to the next object in case of an error
+            logging.error(f"Failed to generate ORA for object [{object_code}].")
+
+    # The exports are divided over a few worker processes, each with its own Excel instance
+    # that is reused for all its objects
+    n_instances = min(MAX_EXCEL_INSTANCES, len(jobs))
+    with utils.worker_process_pool(max(1, n_instances)) as executor:
+        export_futures = {
+            executor.submit(export_bijlage3_pdfs, jobs[i::n_instances]): jobs[i::n_instances]
+            for i in range(n_instances)
+        }
+
+    for future, batch in export_futures.items():
+        try:
+            results = future.result()
+        except Exception as e:
+            # Excel could not be started, none of the objects of this worker are exported
+            results = [(object_code, str(e)) for object_code, *_ in batch]
+        for object_code, error in results:
+            if error is None:
+                logging.info(f"Successfully generated ORA for object [{object_code}].")
+            else:
+                logging.error(f"An error occurred: {error}")
+                logging.error(f"Failed to generate ORA for object [{object_code}].")
@@ -22,6 +22,7 @@ The script performs the following steps:
 
 Functions:
 - `extract_relevant_ora_data`: Filters ORA data to extract rows with high risk scores.
+- `load_object_risicos`: Loads the high risks from the most recent ORA of one object.
 - `create_word_document`: Creates and configures a Word document based on a template.
 - `save_document`: Saves the Word document to a specified directory.
 - `process_hoogste_risico`: Adds individual risk data to the Word document table.
@@ -40,6 +41,8 @@ import os
 import pandas as pd
 import docx
 import datetime as dt
+from docx.enum.style import WD_STYLE_TYPE
+from docx.table import _Row
 from .ora_to_word import (
     load_ora,
     configure_document_styles,
@@ -51,13 +54,31 @@ from .utils import (
     setup_logger,
     save_document,
     convert_docx_to_pdf,
+    worker_count,
+    worker_process_pool,
 )
 import logging
 import time
+import warnings
+from typing import Sequence
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.styles import Font, PatternFill, Alignment
-from openpyxl.worksheet.table import Table, TableStyleInfo
+from openpyxl.worksheet.filters import AutoFilter
+from openpyxl.worksheet.table import Table, TableColumn, TableStyleInfo
+
+# The ORA columns shown in the columns of the Word table, in order
+WORD_TABLE_COLUMNS = [
+    "object_code",
+    "Element",
+    "Bouwdeel",
+    "Actuele Risicoscore",
+    "Actueel Risiconiveau",
+    "Bureaustudie:\n- Instandhoudingsrapportages\n- Toestandsinpecties\n- Overig",
+    "Toelichting.1",
+]
 
 
 def extract_relevant_ora_data(ora: pd.DataFrame) -> pd.DataFrame:
@@ -71,11 +92,39 @@ def extract_relevant_ora_data(ora: pd.DataFrame) -> pd.DataFrame:
         pd.DataFrame: Filtered ORA DataFrame.
     """
 
-    ora['Actuele Risicoscore'] = ora['Actuele Risicoscore'].fillna(0).astype(int)
-    idx_risicos = ora[
-        ora["Actuele Risicoscore"] >= 6
-    ].index  # Filter rows with score >= 6
-    return ora.loc[idx_risicos]
+    # Filter rows with score >= 6. Empty scores (NaN) compare as False, so only the
+    # rows that are kept need to be converted to int.
+    scores = pd.to_numeric(ora['Actuele Risicoscore'])
+    is_risico = (scores >= 6).to_numpy()
+    ora_risico = ora[is_risico].copy()
+    ora_risico['Actuele Risicoscore'] = scores[is_risico].astype(int)
+    return ora_risico
+
+
+def load_object_risicos(path_object: str, object_code: str) -> pd.DataFrame:
+    """
+    Load the most recent ORA of an object and extract the rows with high risk scores.
+    The objects are independent, so this runs in a worker process.
+
+    Parameters:
+        path_object (str): Path to the object directory.
+        object_code (str): Code of the object.
+
+    Returns:
+        pd.DataFrame: Filtered ORA DataFrame, with the object code in column "object_code".
+    """
+    path_ora = return_most_recent_ora(path_object)
+    logging.info("Most recent ORA file located: %s", path_ora)
+
+    # Load and process ORA data
+    ora = load_ora(path_ora)
+    logging.info("ORA data loaded successfully for object code: %s", object_code)
+
+    ora_risico = extract_relevant_ora_data(ora)
+    logging.info("Relevant ORA data extracted for object code: %s", object_code)
+
+    ora_risico["object_code"] = object_code
+    return ora_risico
 
 
 def create_word_document(template_path: str, werkpakket: str) -> docx.Document:
@@ -118,46 +167,28 @@ def create_word_document(template_path: str, werkpakket: str) -> docx.Document:
     return document
 
 def process_hoogste_risico(
-    document: docx.Document,
-    measure: pd.Series,
-    counter: int,
-    cell_style: str
+    row: _Row,
+    measure: Sequence,
+    cell_style_id: str
 ) -> None:
     """
-    Process each risico and add it to the Word document table.
+    Process each risico and fill it in a new row of the Word document table.
 
     Parameters:
-        document (docx.Document): The Word document object.
-        measure (pd.Series): A row from the ORA_MAATREGEL DataFrame.
-        counter (int): The row counter of table of the word document
-        idx (int): Current idx of the row of the DataFrame.
-        cell_style (str): Style name to apply to table cells.
+        row (docx.table._Row): The row added to the table for this risico.
+        measure (Sequence): The values of a row from the ORA_MAATREGEL DataFrame,
+            in the order of `WORD_TABLE_COLUMNS`.
+        cell_style_id (str): Style id of the paragraph style to apply to table cells,
+            as resolved by `document.part.get_style_id`.
     """
-    table = document.tables[0]
-    table.add_row()
+    # The cells of the row are listed once; table.cell() would walk the whole table per cell
+    row_cells = row.cells
 
     # Populate table cells
-
-    table.cell(counter + 1, 0).text = str(measure["object_code"])
-    table.cell(counter + 1, 0).paragraphs[0].style = cell_style
-
-    table.cell(counter + 1, 1).text = str(measure['Element'].partition(',')[0])
-    table.cell(counter + 1, 1).paragraphs[0].style = cell_style
-
-    table.cell(counter + 1, 2).text = str(measure['Bouwdeel'])
-    table.cell(counter + 1, 2).paragraphs[0].style = cell_style
-
-    table.cell(counter + 1, 3).text = str(measure['Actuele Risicoscore'])
-    table.cell(counter + 1, 3).paragraphs[0].style = cell_style
-
-    table.cell(counter + 1, 4).text = str(measure['Actueel Risiconiveau'])
-    table.cell(counter + 1, 4).paragraphs[0].style = cell_style
-
-    table.cell(counter + 1, 5).text = str(measure["Bureaustudie:\n- Instandhoudingsrapportages\n- Toestandsinpecties\n- Overig"])
-    table.cell(counter + 1, 5).paragraphs[0].style = cell_style
-
-    table.cell(counter + 1, 6).text = str(measure["Toelichting.1"])
-    table.cell(counter + 1, 6).paragraphs[0].style = cell_style
+    for cell, value in zip(row_cells, measure):
+        cell.text = str(value)
+        # Set the style id in the XML directly; the style is looked up by name only once, in main()
+        cell.paragraphs[0]._p.style = cell_style_id
 
 
 def save_dataframe_to_excel(
@@ -175,34 +206,59 @@ def save_dataframe_to_excel(
 
     # Filter and rename columns in the DataFrame
     df = df[list(col_mapping.keys())].rename(columns=col_mapping)
-    df["Element"] = df["Element"].str.split(",").str[0]
 
     # Define the file path
     excel_file_path = os.path.join(save_location, f"{batch_name} Hoogste Risicos.xlsx")
 
-    # Create a new workbook and select the active worksheet
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Hoogste Risicos"
+    # Create a write-only workbook: the rows are streamed to the file when saving,
+    # without keeping a Cell object for every cell in memory.
+    # The formatting is therefore set up before the rows are written.
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Hoogste Risicos")
 
-    # Write the DataFrame to the worksheet
-    for r_idx, row in enumerate(
-        dataframe_to_rows(df, index=False, header=True), start=1
-    ):
-        for c_idx, value in enumerate(row, start=1):
-            ws.cell(row=r_idx, column=c_idx, value=value)
+    # Apply formatting to the columns
+    column_widths = {
+        "A": 12,
+        "B": 35,
+        "C": 35,
+        "D": 12,
+        "E": 20,
+        "F": 80,
+        "G": 80,
+    }
+    for col, width in column_widths.items():
+        ws.column_dimensions[col].width = width
 
-    # Apply formatting to the header row
+    # Formatting of the header row, and text wrapping for all cells
     header_fill = PatternFill(
         start_color="FFA500", end_color="FFA500", fill_type="solid"
     )
     header_font = Font(bold=True)
-    for cell in ws[1]:
-        cell.fill = header_fill
-        cell.font = header_font
+    alignment = Alignment(wrap_text=True, vertical="top")
+
+    def styled_cell(value, header=False) -> WriteOnlyCell:
+        cell = WriteOnlyCell(ws, value=value)
+        cell.alignment = alignment
+        if header:
+            cell.fill = header_fill
+            cell.font = header_font
+        return cell
+
+    # Write the DataFrame to the worksheet, a whole row per call
+    rows = dataframe_to_rows(df, index=False, header=True)
+    ws.append([styled_cell(value, header=True) for value in next(rows)])
+    for row in rows:
+        ws.append([styled_cell(value) for value in row])
 
     # Create a table for the data
-    table = Table(displayName="HoogsteRisicosTable", ref=ws.dimensions)
+    table_ref = f"A1:{get_column_letter(len(df.columns))}{len(df) + 1}"
+    table = Table(displayName="HoogsteRisicosTable", ref=table_ref)
+    # A write-only sheet cannot read back the header cells, so the table columns are named here.
+    # openpyxl then skips its own column setup, which also adds the header filter buttons
+    table.tableColumns = [
+        TableColumn(id=idx, name=str(name)) for idx, name in enumerate(df.columns, start=1)
+    ]
+    table.autoFilter = AutoFilter(ref=table_ref)
     style = TableStyleInfo(
         name="TableStyleMedium7",
         showFirstColumn=False,
@@ -211,25 +267,10 @@ def save_dataframe_to_excel(
         showColumnStripes=True,
     )
     table.tableStyleInfo = style
-    ws.add_table(table)
-
-    # Apply formatting to the columns
-    column_widths = {
-        "A": 12,
-        "B": 35,
-        "C": 35,
-        "D": 12,
-        "E": 20,
-        "F": 80,
-        "G": 80,
-    }
-    for col, width in column_widths.items():
-        ws.column_dimensions[col].width = width
-
-    # Apply text wrapping to all cells
-    for row in ws.iter_rows():
-        for cell in row:
-            cell.alignment = Alignment(wrap_text=True, vertical="top")
+    with warnings.catch_warnings():
+        # openpyxl always warns about the table columns in write-only mode; they are set above
+        warnings.filterwarnings("ignore", message="In write-only mode you must add table columns")
+        ws.add_table(table)
 
     # Save the workbook
     wb.save(excel_file_path)
@@ -271,22 +312,25 @@ def main():
     object_paths_codes = get_object_paths_codes()
     logger.info("Object paths and codes retrieved successfully.")
 
-    df_hoogste_risicos = pd.DataFrame()
-
-    for path_object, object_code in object_paths_codes:
+    # Reading the ORA files is independent per object, so they are read in parallel worker
+    # processes (parsing Excel is CPU-bound, so threads would mostly wait for each other)
+    object_paths_codes = list(object_paths_codes)
+    with worker_process_pool(worker_count()) as executor:
+        futures = [
+            executor.submit(load_object_risicos, path_object, object_code)
+            for path_object, object_code in object_paths_codes
+        ]
+
+    # Combine the results in the original order of the objects, in a single concat:
+    # concatenating per object would copy the growing DataFrame again for every object
+    frames = []
+    for (path_object, object_code), future in zip(object_paths_codes, futures):
         logger.info("Processing object code: %s", object_code)
-        path_ora = return_most_recent_ora(path_object)
-        logger.info("Most recent ORA file located: %s", path_ora)
-
-        # Load and process ORA data
-        ora = load_ora(path_ora)
-        logger.info("ORA data loaded successfully for object code: %s", object_code)
+        frames.append(future.result())
+    df_hoogste_risicos = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
 
-        ora_risico = extract_relevant_ora_data(ora)
-        logger.info("Relevant ORA data extracted for object code: %s", object_code)
-
-        ora_risico["object_code"] = object_code
-        df_hoogste_risicos = pd.concat([df_hoogste_risicos, ora_risico], ignore_index=True)
+    # Only the first part of the element (before the comma) is reported, in Word and Excel
+    df_hoogste_risicos["Element"] = df_hoogste_risicos["Element"].str.partition(",")[0]
 
     logger.info(
         "All object codes processed. Total risks identified: %d",
@@ -298,13 +342,19 @@ def main():
     logger.info("Word document created and configured.")
 
     # Process each measure and add to document
-    for counter, risico in df_hoogste_risicos.iterrows():
-        logger.debug("Adding risico to document: %s", risico.to_dict())
+    # Look up the table and resolve the cell style once for all rows
+    table = document.tables[0]
+    cell_style_id = document.part.get_style_id('Cell', WD_STYLE_TYPE.PARAGRAPH)
+
+    # The values of the table columns are taken per row by position, as plain lists;
+    # iterrows would build a Series (with dtype inference) for every row
+    records = df_hoogste_risicos[WORD_TABLE_COLUMNS].to_numpy().tolist()
+    for risico in records:
+        logger.debug("Adding risico to document: %s", risico)
         process_hoogste_risico(
-            document=document,
+            row=table.add_row(),
             measure=risico,
-            counter=counter,
-            cell_style='Cell'
+            cell_style_id=cell_style_id
         )
     logger.info("All risks added to the Word document.")
 
@@ -40,12 +40,14 @@ import datetime as dt
 import logging
 import math
 import os
+from typing import Iterable
 
 # External modules
 import openpyxl
 from openpyxl.cell.rich_text import CellRichText, TextBlock
 from openpyxl.cell.text import InlineFont
 from openpyxl.styles import Alignment, Font
+from openpyxl.styles.cell_style import StyleArray
 from PIL import JpegImagePlugin
 
 # Local imports
@@ -67,6 +69,65 @@ FONT_ARIAL_18 = Font(name="Arial", size=18, bold=False)
 # Constants for the alignment style
 ALIGNMENT_LEFT = Alignment(horizontal="left", vertical="top", wrap_text=True)
 
+# Standard texts of the Aanbeveling (Sheet4) and Bevindingenv2 (Sheet11)
+AANBEVELING_INTRO_TEXT = "Voor de volledige uitwerking van het planoverzicht in MIOK, wordt verwezen naar hoofdstuk 2. Hierin zijn per instandhoudingsonderdeel de onderhouds- en/of vervangingsmaatregelen inclusief bijbehorende kosten opgenomen."
+GEEN_NADER_ONDERZOEK_TEXT = "Nader onderzoek:\nZowel vanuit de opgestelde (i-)ORA als vanuit de uitgevoerde inspectiewerkzaamheden is geen noodzaak gebleken voor het uitvoeren van een nader onderzoek."
+GEEN_DIRECTE_MAATREGEL_TEXT = "Directe maatregelen:\nBij dit object zijn geen directe maatregelen noodzakelijk geacht."
+AANDACHTSPUNTEN_BEHEERDER_TEXT = "Aandachtspunten voor de beheerder:\nIn Bijlage 9: Aandachtspunten voor de beheerder zijn de schades opgenomen die geconstateerd zijn tijdens de inspectie maar, volgens de risicoanalyse, geen risico initiëren voor het functioneren van het object. Daarnaast zijn de schades opgenomen die vallen onder standaard verzorgend onderhoud"
+GEEN_NIET_SCHADE_GERELATEERD_TEXT = "Niet schade gerelateerde / gebruiksspecifieke risicos:\nBij dit beheerobject zijn (geen)  niet- schadegerelateerde/ gebruiksspecifieke risico’s aanwezig.\n\nVoor de volledige uitwerking en onderbouwing (inclusief eventuele schadeomschrijvingen) wordt verwezen naar Bijlage 8: Risico- en schadeomschrijving."
+GEEN_CONSTRUCTIEVE_BEOORDELING_TEXT = "Analyse constructieve beoordeling:\nOp basis van het objecttype is geen nadere constructieve beoordeling volgens het constructieve risico-indexerings- en afwegingsmodel (CRIAM) uitgevoerd.\n\nVoor de volledige uitwerking en onderbouwing (inclusief eventuele schadeomschrijvingen) wordt verwezen naar Bijlage 8: Risico- en schadeomschrijving"
+WEL_CONSTRUCTIEVE_BEOORDELING_TEXT = "Op basis van het objecttype is een nadere constructieve beoordeling volgens het constructieve risico-indexerings- en afwegingsmodel (CRIAM) uitgevoerd."
+
+
+def set_style(
+    sheet: openpyxl.worksheet.worksheet.Worksheet,
+    cells: Iterable,
+    font: Font,
+    alignment: Alignment = None,
+) -> None:
+    """
+    Set the same font (and optionally alignment) on one or more cells of a worksheet.
+    `cell.font = font` looks the font up in the font list of the workbook for every cell, which
+    hashes the complete Font each time. Here the font and alignment are looked up once and only
+    their indices are set on the cells; other style parts of the cells (borders, fills, number
+    formats) are kept.
+
+    Parameters:
+        sheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet the cells belong to.
+        cells (Iterable): The cells to style.
+        font (Font): The font to set.
+        alignment (Alignment): The alignment to set. Left unchanged if None.
+    """
+    font_id = sheet.parent._fonts.add(font)
+    alignment_id = sheet.parent._alignments.add(alignment) if alignment is not None else None
+    for cell in cells:
+        if cell._style is None:
+            cell._style = StyleArray()
+        cell._style.fontId = font_id
+        if alignment_id is not None:
+            cell._style.alignmentId = alignment_id
+
+
+def write_cells(sheet: openpyxl.worksheet.worksheet.Worksheet, values: dict, font: Font = None) -> None:
+    """
+    Write values to cells of a worksheet, optionally with the same font for all of them.
+    The cells are given by (row, column), so no coordinate string is parsed per cell as with
+    `sheet["H14"]`, and the font is set with `set_style`. The existing cells are written to,
+    so their other style parts from the inspectierapport are kept.
+
+    Parameters:
+        sheet (openpyxl.worksheet.worksheet.Worksheet): The worksheet object.
+        values (dict): Values to write, by (row, column) of the cell, e.g. (14, 8) for H14.
+        font (Font): The font to set on the written cells. Left unchanged if None.
+    """
+    cells = []
+    for (row, column), value in values.items():
+        cell = sheet.cell(row=row, column=column)
+        cell.value = value
+        cells.append(cell)
+    if font is not None:
+        set_style(sheet, cells, font)
+
 
 def find_inspectierapport(directory: str) -> str:
     """
@@ -84,24 +145,25 @@ def find_inspectierapport(directory: str) -> str:
         f"Searching for .xlsx-files in [{directory}], starting with 'inspectieRapport' (case insensitive)"
     )
 
-    # List to hold all file paths
-    matching_files = []
-
-    # Walk through the directory and its subdirectories
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.lower().startswith("inspectierapport") and file.lower().endswith(".xlsx"):
-                # Get the full path and modification time of the inspectie
-                file_path = os.path.join(root, file)
-                matching_files.append(file_path)
-                logging.debug(f"Found matching file: [{file_path}]")
-
-    if not matching_files:
+    most_recent_file = None
+    most_recent_time = None
+
+    # Only list the directory itself; the modification time comes from the directory entry
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name.lower()
+            if name.startswith("inspectierapport") and name.endswith(".xlsx") and entry.is_file():
+                logging.debug(f"Found matching file: [{entry.path}]")
+                modification_time = entry.stat().st_mtime
+                if most_recent_time is None or modification_time > most_recent_time:
+                    most_recent_file = entry.path
+                    most_recent_time = modification_time
+
+    if most_recent_file is None:
         logging.info("No matching file found.")
         return None
 
-    # Select the file name, based on the most recent time
-    most_recent_file = max(matching_files, key=os.path.getmtime)
+    # The file name, based on the most recent time
     logging.info(f"Most recent file found: [{most_recent_file}]")
     return most_recent_file  # Full path of the most recent file
 
@@ -135,16 +197,16 @@ def set_footer(
     for i in range(2, sheets_count):
         sheet = wb[sheet_names[i]]
 
-        # Define footer content mapping
-        footer_content = {"left": FOOTER_LEFT, "center": "", "right": FOOTER_RIGHT}
-
         # Set footer content for both even and odd footers
-        for footer_type in ["evenFooter", "oddFooter"]:
-            footer = getattr(sheet, footer_type)
-            for position, content in footer_content.items():
-                getattr(footer, position).text = content
-                getattr(footer, position).font = "Arial"
-                getattr(footer, position).size = 7
+        for footer in (sheet.evenFooter, sheet.oddFooter):
+            for part, content in (
+                (footer.left, FOOTER_LEFT),
+                (footer.center, ""),
+                (footer.right, FOOTER_RIGHT),
+            ):
+                part.text = content
+                part.font = "Arial"
+                part.size = 7
 
     logging.debug("Footers set successfully.")
 
@@ -178,17 +240,22 @@ def populate_title_page(
 
     moment_of_inspection = sheet7["E9"].value
     year_of_inspection = int(moment_of_inspection.split(" ")[-1])
-    sheet["B5"] = f"Inspectierapport Instandhoudingsinspectie {year_of_inspection}"
-    sheet["H14"] = opdrachtgever
-    sheet["H15"] = contactpersoon_rws
-    sheet["H16"] = f"{zaaknr}"
-    sheet["F23"] = f"{versie:.1f}"
-    sheet["J23"] = datum
-    sheet["L23"] = omschrijving
-    sheet["D25"] = opdrachtnemer
-    sheet["C27"] = opsteller
-    sheet["I27"] = kwaliteitsbeheerser
-    sheet["O27"] = projectleider
+    write_cells(
+        sheet,
+        {
+            (5, 2): f"Inspectierapport Instandhoudingsinspectie {year_of_inspection}",  # B5
+            (14, 8): opdrachtgever,  # H14
+            (15, 8): contactpersoon_rws,  # H15
+            (16, 8): f"{zaaknr}",  # H16
+            (23, 6): f"{versie:.1f}",  # F23
+            (23, 10): datum,  # J23
+            (23, 12): omschrijving,  # L23
+            (25, 4): opdrachtnemer,  # D25
+            (27, 3): opsteller,  # C27
+            (27, 9): kwaliteitsbeheerser,  # I27
+            (27, 15): projectleider,  # O27
+        },
+    )
 
     # Adjust row heights
     sheet.row_dimensions[10].height = 30
@@ -239,46 +306,43 @@ def populate_aanbeveling_sheet(
     sheet["C5"] = "1  Aanbeveling"
     sheet["C5"].font = FONT_ARIAL_18
     # standaard tekst
-    intro_text = "Voor de volledige uitwerking van het planoverzicht in MIOK, wordt verwezen naar hoofdstuk 2. Hierin zijn per instandhoudingsonderdeel de onderhouds- en/of vervangingsmaatregelen inclusief bijbehorende kosten opgenomen."
     venr_text = f"V&R-indicatie:\nDe V&R-indicatie geeft weer in welk jaar de verwachte renovatie of vervanging gepland staat. Op basis van de ORA wordt hiervan een inschatting gemaakt. Voor dit object is de V&R-indicatie gesteld op {venr}. Hierbij dient uit te worden gegaan van een volledige renovatie van het object."
-    geen_nader_onderzoek_text = "Nader onderzoek:\nZowel vanuit de opgestelde (i-)ORA als vanuit de uitgevoerde inspectiewerkzaamheden is geen noodzaak gebleken voor het uitvoeren van een nader onderzoek."
     wel_nader_onderzoek_text = f"Nader onderzoek:\nVanuit de uitgevoerde inspectiewerkzaamheden wordt het volgende nader onderzoek geadviseerd: {nader_onderzoek}"
-    geen_directe_maatregel_text = (
-        "Directe maatregelen:\nBij dit object zijn geen directe maatregelen noodzakelijk geacht."
-    )
     wel_directe_maatregel_text = f"Directe maatregelen:\nBij dit object zijn de volgende directe maatregelen noodzakelijk geacht: {directe_maatregel}"
-    aandachtspunten_beheerder_text = "Aandachtspunten voor de beheerder:\nIn Bijlage 9: Aandachtspunten voor de beheerder zijn de schades opgenomen die geconstateerd zijn tijdens de inspectie maar, volgens de risicoanalyse, geen risico initiëren voor het functioneren van het object. Daarnaast zijn de schades opgenomen die vallen onder standaard verzorgend onderhoud"
 
     max_row_count = sheet.max_row
     start_table = 9
-    for row in sheet[f"D{start_table}:D{max_row_count}"]:
-        cell = row[0]
-        if cell.value:
-            index_row = cell.row
-            sheet.row_dimensions[index_row].height = 30
-        else:
-            end_table = index_row
-            break
+    # Read column D once; the table ends before the first empty cell
+    column_d = [
+        value
+        for (value,) in sheet.iter_rows(
+            min_row=start_table, max_row=max_row_count, min_col=4, max_col=4, values_only=True
+        )
+    ]
+    table_length = next((idx for idx, value in enumerate(column_d) if not value), len(column_d))
+    end_table = start_table + table_length - 1
+    for row in range(start_table, end_table + 1):
+        sheet.row_dimensions[row].height = 30
 
-    counter = 0
     text_voor_aanbeveling = ("\n\n").join(
         [
-            intro_text,
+            AANBEVELING_INTRO_TEXT,
             # venr_text,
-            (wel_nader_onderzoek_text if nader_onderzoek else geen_nader_onderzoek_text),
-            (wel_directe_maatregel_text if directe_maatregel else geen_directe_maatregel_text),
-            aandachtspunten_beheerder_text,
+            (wel_nader_onderzoek_text if nader_onderzoek else GEEN_NADER_ONDERZOEK_TEXT),
+            (wel_directe_maatregel_text if directe_maatregel else GEEN_DIRECTE_MAATREGEL_TEXT),
+            AANDACHTSPUNTEN_BEHEERDER_TEXT,
         ]
     )
 
-    for row in sheet[f"D{end_table + 1}:D{max_row_count}"]:
-        cell = row[0]
-        if cell.value and counter == 0:
-            counter += 1
-            cell.value = text_voor_aanbeveling
-            sheet.row_dimensions[cell.row].height = 300
-        else:
-            cell.value = ""
+    # The text replaces the first filled cell below the table, the other cells are cleared
+    text_written = False
+    for row, value in enumerate(column_d[table_length:], start=end_table + 1):
+        if value and not text_written:
+            text_written = True
+            sheet.cell(row=row, column=4).value = text_voor_aanbeveling
+            sheet.row_dimensions[row].height = 300
+        elif value is not None:
+            sheet.cell(row=row, column=4).value = ""
     logging.debug("Aanbeveling populated and formatted successfully.")
 
 
@@ -310,9 +374,11 @@ def populate_miok_sheet(sheet: openpyxl.worksheet.worksheet.Worksheet, variables
     row_count = sheet.max_row
     sheet.column_dimensions["AH"].width = 4
 
-    for row in sheet.iter_rows(min_row=1, max_row=row_count):
-        for cell in row:
-            cell.font = FONT_ARIAL_7
+    set_style(
+        sheet,
+        (cell for row in sheet.iter_rows(min_row=1, max_row=row_count) for cell in row),
+        FONT_ARIAL_7,
+    )
 
     sheet.print_area = f"A1:AL{row_count}"
     sheet.sheet_properties.pageSetUpPr.fitToPage = True
@@ -350,14 +416,12 @@ def populate_inleiding_sheet(
     # sheet['E13'] = hulpmiddelen
 
     # standaard tekst 3.2
-    sheet["D15"].font = FONT_ARIAL_10
-    sheet["D15"].alignment = ALIGNMENT_LEFT
+    set_style(sheet, [sheet["D15"]], FONT_ARIAL_10, ALIGNMENT_LEFT)
     sheet.row_dimensions[15].height = 70
     sheet.row_dimensions[16].height = 15
 
     # standaard tekst 3.3
-    sheet["D18"].font = FONT_ARIAL_10
-    sheet["D18"].alignment = ALIGNMENT_LEFT
+    set_style(sheet, [sheet["D18"]], FONT_ARIAL_10, ALIGNMENT_LEFT)
     sheet.row_dimensions[18].height = 70
     sheet.row_dimensions[19].height = 15
 
@@ -408,8 +472,7 @@ def populate_risicoanalyse_sheet(
     # standaard tekst 5.2
     sheet["C10"].font = FONT_ARIAL_12
     sheet["D10"].font = FONT_ARIAL_12
-    sheet["D12"].font = FONT_ARIAL_10
-    sheet["D12"].alignment = ALIGNMENT_LEFT
+    set_style(sheet, [sheet["D12"]], FONT_ARIAL_10, ALIGNMENT_LEFT)
     sheet.row_dimensions[12].height = 85
 
     # standaard tekst 5.3
@@ -422,8 +485,7 @@ def populate_risicoanalyse_sheet(
         "bereikbaarheidsmiddelen heeft de IU standaard een kleine inspectieboot en ladder\n"
         "beschikbaar tijdens de inspectie. "
     )
-    sheet["D16"].font = FONT_ARIAL_10
-    sheet["D16"].alignment = ALIGNMENT_LEFT
+    set_style(sheet, [sheet["D16"]], FONT_ARIAL_10, ALIGNMENT_LEFT)
     sheet.row_dimensions[16].height = 75
     logging.debug("Risicoanalyse populated and formatted successfully.")
 
@@ -448,11 +510,11 @@ def populate_bevindingen_sheet(
         sheet["E5"].font = FONT_ARIAL_18
         sheet["E7"].font = FONT_ARIAL_12
 
+        # The height follows from the length of the text in column I, in one pass over that column
         row_count = sheet.max_row
-        for row in range(12, row_count + 1):
-            text = sheet[f"I{row}"].value
+        texts = sheet.iter_rows(min_row=12, max_row=row_count, min_col=9, max_col=9, values_only=True)
+        for row, (text,) in enumerate(texts, start=12):
             text_length = len(text) if text else 0
-            sheet.row_dimensions[row].height = None
             if text_length <= 200:
                 sheet.row_dimensions[row].height = 105
             else:
@@ -475,25 +537,22 @@ def populate_bevindingenv2_sheet(
     niet_schade_gerelateerd = variables.get("niet_schade_gerelateerd")
     constructieve_beoordeling = variables.get("constructieve_beoordeling")
 
-    geen_niet_schade_gerelateerd_text = "Niet schade gerelateerde / gebruiksspecifieke risicos:\nBij dit beheerobject zijn (geen)  niet- schadegerelateerde/ gebruiksspecifieke risico’s aanwezig.\n\nVoor de volledige uitwerking en onderbouwing (inclusief eventuele schadeomschrijvingen) wordt verwezen naar Bijlage 8: Risico- en schadeomschrijving."
     wel_niet_schade_gerelateerd_text = f"Niet schade gerelateerde / gebruiksspecifieke risicos:\nBij dit beheerobject zijn de volgende niet schade gerelateerde / gebruiksspecifieke risico’s geconstateerd: {niet_schade_gerelateerd}"
-    geen_constructieve_beoordeling_text = "Analyse constructieve beoordeling:\nOp basis van het objecttype is geen nadere constructieve beoordeling volgens het constructieve risico-indexerings- en afwegingsmodel (CRIAM) uitgevoerd.\n\nVoor de volledige uitwerking en onderbouwing (inclusief eventuele schadeomschrijvingen) wordt verwezen naar Bijlage 8: Risico- en schadeomschrijving"
-    wel_constructieve_beoordeling_text = "Op basis van het objecttype is een nadere constructieve beoordeling volgens het constructieve risico-indexerings- en afwegingsmodel (CRIAM) uitgevoerd."
 
     sheet["C4"].font = FONT_ARIAL_12
     sheet["D4"].font = FONT_ARIAL_12
     sheet["D6"] = (
         wel_niet_schade_gerelateerd_text
         if niet_schade_gerelateerd
-        else geen_niet_schade_gerelateerd_text
+        else GEEN_NIET_SCHADE_GERELATEERD_TEXT
     )
     sheet["D6"].font = FONT_ARIAL_10
     sheet["C8"].font = FONT_ARIAL_12
     sheet["D8"].font = FONT_ARIAL_12
     sheet["D10"] = (
-        wel_constructieve_beoordeling_text
+        WEL_CONSTRUCTIEVE_BEOORDELING_TEXT
         if constructieve_beoordeling
-        else geen_constructieve_beoordeling_text
+        else GEEN_CONSTRUCTIEVE_BEOORDELING_TEXT
     )
     sheet.row_dimensions[6].height = 80
     sheet.row_dimensions[10].height = 80
@@ -518,22 +577,20 @@ def populate_colofon_sheet(sheet: openpyxl.worksheet.worksheet.Worksheet, variab
     code_object = variables.get("object_code", "UNKNOWN")
 
     sheet["C4"].font = FONT_ARIAL_18
-    sheet["E7"] = f": {opdrachtgever}"
-    sheet["E7"].font = FONT_ARIAL_10
-    sheet["E8"] = f": {contactpersoon_rws}"
-    sheet["E8"].font = FONT_ARIAL_10
-    sheet["D9"] = "Zaaknummer"
-    sheet["D9"].font = FONT_ARIAL_10
-    sheet["E9"] = f": {zaaknummer}"
-    sheet["E9"].font = FONT_ARIAL_10
-    sheet["E10"] = f": {opdrachtnemer}"
-    sheet["E10"].font = FONT_ARIAL_10
-    sheet["E11"] = f": {contactpersoon}"
-    sheet["E11"].font = FONT_ARIAL_10
-    sheet["E12"] = f": {projectnummer}"
-    sheet["E12"].font = FONT_ARIAL_10
-    sheet["E13"] = f": PI rapport {code_object}.pdf"
-    sheet["E13"].font = FONT_ARIAL_10
+    write_cells(
+        sheet,
+        {
+            (7, 5): f": {opdrachtgever}",  # E7
+            (8, 5): f": {contactpersoon_rws}",  # E8
+            (9, 4): "Zaaknummer",  # D9
+            (9, 5): f": {zaaknummer}",  # E9
+            (10, 5): f": {opdrachtnemer}",  # E10
+            (11, 5): f": {contactpersoon}",  # E11
+            (12, 5): f": {projectnummer}",  # E12
+            (13, 5): f": PI rapport {code_object}.pdf",  # E13
+        },
+        font=FONT_ARIAL_10,
+    )
     logging.debug("Colofon populated and formatted successfully.")
 
 
@@ -590,9 +647,7 @@ def populate_bijlage4_sheet(sheet: openpyxl.worksheet.worksheet.Worksheet, varia
     logging.debug("Populating Bijlage 4 (Sheet16)...")
     sheet["B4"].font = FONT_ARIAL_16
     row_count = sheet.max_row
-    for row in range(12, row_count):
-        for cell in sheet[row]:
-            cell.font = FONT_ARIAL_8
+    set_style(sheet, (cell for row in range(12, row_count) for cell in sheet[row]), FONT_ARIAL_8)
     highlighted_rows = list(range(13, row_count + 5))[0::10]
     for row in highlighted_rows:
         sheet.row_dimensions[row].height = 22
@@ -618,8 +673,7 @@ def _populate_bijlage5_sheet(sheet: openpyxl.worksheet.worksheet.Worksheet) -> N
         # Copy the content, and clear the original
         sheet["C10"].value = sheet["C8"].value
         sheet["C8"].value = ""
-        sheet["C10"].font = FONT_ARIAL_10
-        sheet["C10"].alignment = ALIGNMENT_LEFT
+        set_style(sheet, [sheet["C10"]], FONT_ARIAL_10, ALIGNMENT_LEFT)
         sheet.row_dimensions[10].height = 300
         sheet.row_dimensions[10].hidden = False
         # sheet.row_dimensions[7].height = 300
@@ -654,9 +708,12 @@ def populate_bijlage5_plus_return_next_idx(wb: openpyxl.Workbook) -> int:
         # Check if cell B4 contains "Omgevingsfoto schade". In that case, the Sheet18 (and beyond) is
         # populated with additional schadefoto. These should be processed until a sheet is found
         # that does not contain "Omgevingsfoto schade" in cell B4.
-        if sheet["C4"].value == "Omgevingsfoto schade":
-            # Perform the required operations
-            if sheet.row_dimensions[8].height >= 5:
+        # C4 and row 8 are read without creating the cell or row dimension if they do not exist.
+        cell_c4 = sheet._cells.get((4, 3))
+        if cell_c4 is not None and cell_c4.value == "Omgevingsfoto schade":
+            # Perform the required operations. A row without dimension has the default height.
+            row_8 = sheet.row_dimensions.get(8)
+            if row_8 is None or row_8.height is None or row_8.height >= 5:
                 # Move the text from C6 to C8. The workbook is NOT loaded with rich text, so the value is plain text.
                 cell_text = sheet["C6"].value
 
@@ -677,8 +734,7 @@ def populate_bijlage5_plus_return_next_idx(wb: openpyxl.Workbook) -> int:
                 # sheet["C8"].value = rich_text
                 sheet["C8"].value = cell_text
                 # (font settings already done in the rich text creation)
-                sheet["C8"].font = FONT_ARIAL_10
-                sheet["C8"].alignment = ALIGNMENT_LEFT
+                set_style(sheet, [sheet["C8"]], FONT_ARIAL_10, ALIGNMENT_LEFT)
 
                 # Wipe the original cell
                 sheet["C6"].value = ""
@@ -957,7 +1013,7 @@ def process_pi_report_for_object(object_path: str, report_path: str, config: dic
     populate_bijlage8_3_sheet(wb_report[sheet_names[next_sheet_idx + 6]], config_variables)
     populate_bijlage9_sheet(wb_report[sheet_names[next_sheet_idx + 7]], config_variables)
     populate_bijlage10_sheet(wb_report[sheet_names[next_sheet_idx + 8]], config_variables)
-    set_footer(wb_report, wb_report.sheetnames, config_variables, len(wb_report.sheetnames))
+    set_footer(wb_report, sheet_names, config_variables, len(sheet_names))
     logging.info("Finished populating the PI report.")
 
     # Save the workbook
@@ -969,6 +1025,28 @@ def process_pi_report_for_object(object_path: str, report_path: str, config: dic
     return xls_path
 
 
+def generate_pi_report(object_path: str, object_code: str, config: dict) -> str:
+    """
+    Find the inspectierapport of an object and generate the PI report from it.
+    Runs in a worker process, so it only takes and returns picklable values.
+
+    Parameters:
+        object_path (str): Path to the object.
+        object_code (str): Code of the object.
+        config (dict): Configuration dictionary, updated with the voortgang of the object.
+
+    Returns:
+        str: Path to the saved PI report (xlsx).
+    """
+    pi_report_path = find_inspectierapport(object_path)
+    if not pi_report_path:
+        logging.error(f"Could not find inspectierapport for [{object_code}]")
+        raise FileNotFoundError(f"Inspectierapport not found for object [{object_code}]")
+
+    # All needed data found and set, so start processing the pi report
+    return process_pi_report_for_object(object_path, pi_report_path, config)
+
+
 def main() -> None:
     """
     Main function to orchestrate the processing of the PI report.
@@ -990,38 +1068,56 @@ def main() -> None:
         names=config.get("expand_name_abbreviations", {}),
     )
 
+    # The voortgang updates of the configuration build on each other, so they are done here in
+    # order; every object gets a snapshot of the configuration for its own report
+    object_configs = []
     for object_path, object_code in utils.get_object_paths_codes():
         logging.info(f"Processing object [{object_code}]")
         try:
             logging.info(f"Updating the configuration variables with voortgang...")
             voortgang = get_voortgang_params(voortgangs_data, object_code)
             config = utils.update_config_with_voortgang(config, voortgang)
-            pi_report_path = find_inspectierapport(object_path)
-            if not pi_report_path:
-                logging.error(f"Could not find inspectierapport for [{object_code}]")
-                raise FileNotFoundError(f"Inspectierapport not found for object [{object_code}]")
-
-            # All needed data found and set, so start processing the pi report
-            new_xlsx_filename = process_pi_report_for_object(object_path, pi_report_path, config)
-
+            object_configs.append((object_path, object_code, config.copy()))
         except Exception as e:
             logging.error(f"Failed to process object [{object_code}]: {e}")
             failed_objects.append(object_code)
-            continue  # Skip to the next object
-
-        try:
-            # Start the printing to PDF (in separate try-catch block)
-            logging.info(f"Printing PI report to PDF for [{object_code}]")
-            xlsx_dir = os.path.dirname(new_xlsx_filename)
-            xlsx_basename = os.path.basename(new_xlsx_filename)
-            pdf_basename = xlsx_basename.replace(".xlsx", ".pdf")
-            pdf_filename = os.path.join(xlsx_dir, config.get("output_folder", ""), pdf_basename)
-            utilsxls.export_to_pdf(new_xlsx_filename, pdf_filename)
-            logging.info(f"PI report printed to PDF for [{object_code}] successfully.")
 
-        except Exception as e:
-            logging.error(f"Failed to print PI report to PDF for [{object_code}]: {e}")
-            failed_objects.append(object_code)
+    # The PI reports are independent workbooks, so they are generated in parallel worker
+    # processes. Excel is driven over COM and stays in this process: it is started once and
+    # prints the reports in order, as soon as each one is ready.
+    with utils.worker_process_pool(utils.worker_count()) as executor:
+        futures = {
+            executor.submit(generate_pi_report, object_path, object_code, object_config): (
+                object_code,
+                object_config,
+            )
+            for object_path, object_code, object_config in object_configs
+        }
+
+        with utilsxls.ExcelSession() as excel:
+            for future, (object_code, object_config) in futures.items():
+                try:
+                    new_xlsx_filename = future.result()
+                except Exception as e:
+                    logging.error(f"Failed to process object [{object_code}]: {e}")
+                    failed_objects.append(object_code)
+                    continue  # Skip to the next object
+
+                try:
+                    # Start the printing to PDF (in separate try-catch block)
+                    logging.info(f"Printing PI report to PDF for [{object_code}]")
+                    xlsx_dir = os.path.dirname(new_xlsx_filename)
+                    xlsx_basename = os.path.basename(new_xlsx_filename)
+                    pdf_basename = xlsx_basename.replace(".xlsx", ".pdf")
+                    pdf_filename = os.path.join(
+                        xlsx_dir, object_config.get("output_folder", ""), pdf_basename
+                    )
+                    utilsxls.export_to_pdf(new_xlsx_filename, pdf_filename, session=excel)
+                    logging.info(f"PI report printed to PDF for [{object_code}] successfully.")
+
+                except Exception as e:
+                    logging.error(f"Failed to print PI report to PDF for [{object_code}]: {e}")
+                    failed_objects.append(object_code)
 
     if failed_objects:
         logger.error("Failed to process the following objects: %s", failed_objects)
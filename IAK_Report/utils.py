@@ -12,18 +12,31 @@ loading configurations, and logging for the IAK Report generation process.
 """
 
 # Built-in imports
+import concurrent.futures
+import contextlib
+import io
 import os
 import re
 import json
 import logging
+import logging.handlers
+import multiprocessing
+import zipfile
 
 # External imports
 import docx
+from docx.opc.pkgwriter import PackageWriter
 from docx2pdf import convert
 
 # Default path to the configuration file
 CONFIG_FILE = os.getenv("CONFIG_FILE", "./config.json")
 
+# ProcessPoolExecutor on Windows raises a ValueError for more than 61 workers
+MAX_WORKER_PROCESSES = 61
+
+# Image formats that are compressed already; deflating them again costs time and saves nothing
+PRECOMPRESSED_MEDIA_EXTENSIONS = (".jpg", ".jpeg", ".png", ".gif")
+
 
 def load_config(config_path=CONFIG_FILE):
     """
@@ -151,17 +164,74 @@ def convert_docx_to_pdf(input_path: str, output_path=None) -> None:
         raise
 
 
-def list_pictures_for_object(object_path):
+def convert_docx_to_pdf_many(input_paths: list) -> list:
+    """
+    Converts several .docx files to PDF in a single Word session (COM automation, Windows only).
+    Starting Word takes seconds, so a batch starts it once instead of once per file.
+    Each PDF is saved in the same directory as its input file with the same name.
+
+    Parameters:
+        input_paths (list): Paths to the input .docx files.
+
+    Returns:
+        list: Path of the PDF per input file, or None if the conversion of that file failed.
+
+    Logs:
+        INFO: When a conversion is successful.
+        ERROR: If an error occurs during a conversion.
+    """
+    import win32com.client
+
+    WD_FORMAT_PDF = 17
+    output_paths = []
+    word = win32com.client.Dispatch("Word.Application")
+    try:
+        for input_path in input_paths:
+            output_path = os.path.splitext(input_path)[0] + ".pdf"
+            try:
+                logging.info("Starting conversion of '%s' to '%s'.", input_path, output_path)
+                document = word.Documents.Open(os.path.abspath(input_path))
+                try:
+                    document.SaveAs(os.path.abspath(output_path), FileFormat=WD_FORMAT_PDF)
+                finally:
+                    document.Close(0)
+                logging.info("Successfully converted '%s' to '%s'.", input_path, output_path)
+                output_paths.append(output_path)
+            except Exception as e:
+                logging.error("An error occurred during conversion of '%s': %s", input_path, e)
+                output_paths.append(None)
+    finally:
+        word.Quit()
+    return output_paths
+
+
+def list_pictures_for_object(object_path, sizes=None):
     """
     Search in the object_path, and list ALL *.png and *.jpg files which are residing 
     in the object_paths or in each subdirectory. 
     It returns the full filenames of the pictures
+
+    If a dict is given as sizes, it is filled with the file size of each picture
+    (full filename -> bytes). On Windows the size comes with the directory listing,
+    so no extra call per file is made, which matters on network shares.
     """
     picture_files = []
-    for root, dirs, files in os.walk(object_path):
-        for filename in files:
-            if filename.lower().endswith((".png", ".jpg", ".jpeg")):
-                picture_files.append(os.path.join(root, filename))
+    # os.scandir returns the file type with the directory listing, so no extra stat call per file
+    stack = [object_path]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Same as os.walk: skip directories that cannot be listed
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.lower().endswith((".png", ".jpg", ".jpeg")):
+                    picture_files.append(entry.path)
+                    if sizes is not None:
+                        sizes[entry.path] = entry.stat().st_size
     return picture_files  # List of all fullfilenames of pictures
 
 
@@ -311,13 +381,26 @@ def return_most_recent_ora(directory: str) -> str:
     """
     logging.info("Searching for ORA files in directory: %s", directory)
 
-    # Walk through the directory and all subdirectories to find matching files
+    # Walk through the directory and all subdirectories to find matching files.
+    # The modification time is taken from the directory listing (os.scandir), which on
+    # Windows comes without an extra call per file.
     ora_files = []
-    for root, dirs, files in os.walk(directory):
-        for file in files:
-            if file.startswith("ORA") and file.endswith((".xlsm", ".xlsb", ".xlsx")):
-                ora_files.append(os.path.join(root, file))
-    logging.debug(f"Filtered ORA files (with full paths): {ora_files}")
+    modification_times = {}
+    stack = [directory]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Same as os.walk: skip directories that cannot be listed
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.startswith("ORA") and entry.name.endswith((".xlsm", ".xlsb", ".xlsx")):
+                    ora_files.append(entry.path)
+                    modification_times[entry.path] = entry.stat().st_mtime_ns
+    logging.debug("Filtered ORA files (with full paths): %s", ora_files)
 
     if not ora_files:
         # Raise FileNotFoundError if no files with "ORA" are found
@@ -326,17 +409,54 @@ def return_most_recent_ora(directory: str) -> str:
             f"No files starting with 'ORA' found in directory: {directory}"
         )
 
-    # Get the full paths of the filtered files
-    full_paths = [os.path.join(directory, file) for file in ora_files]
-    logging.debug(f"Full paths of ORA files: {full_paths}")
-
     # Find the most recently modified file
-    most_recent_file = max(full_paths, key=os.path.getmtime)
+    most_recent_file = max(ora_files, key=modification_times.__getitem__)
     logging.info(f"Most recent ORA file found: {most_recent_file}")
 
     return most_recent_file
 
 
+class _MediaStoringPkgWriter:
+    """
+    Zip writer for a python-docx package (same interface as `docx.opc.phys_pkg.PhysPkgWriter`)
+    that stores JPEG/PNG parts without compression. The other parts (XML) are deflated.
+    """
+
+    def __init__(self, pkg_file):
+        self._zipf = zipfile.ZipFile(pkg_file, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def write(self, pack_uri, blob):
+        if pack_uri.membername.lower().endswith(PRECOMPRESSED_MEDIA_EXTENSIONS):
+            self._zipf.writestr(pack_uri.membername, blob, compress_type=zipfile.ZIP_STORED)
+        else:
+            self._zipf.writestr(pack_uri.membername, blob)
+
+    def close(self):
+        self._zipf.close()
+
+
+def _save_package(document: docx.Document, pkg_file) -> None:
+    """
+    Save a Word document like `document.save`, but with the images stored uncompressed:
+    deflating compressed images again costs time and saves nothing.
+    Follows `OpcPackage.save` and `PackageWriter.write` of python-docx, with another zip writer.
+
+    Args:
+        document (docx.Document): The Word document object to be saved.
+        pkg_file: Path or file-like object to write the docx file to.
+    """
+    package = document.part.package
+    for part in package.parts:
+        part.before_marshal()
+    phys_writer = _MediaStoringPkgWriter(pkg_file)
+    try:
+        PackageWriter._write_content_types_stream(phys_writer, package.parts)
+        PackageWriter._write_pkg_rels(phys_writer, package.rels)
+        PackageWriter._write_parts(phys_writer, package.parts)
+    finally:
+        phys_writer.close()
+
+
 def save_document(document: docx.Document, save_loc: str, file_name: str) -> None:
     """
     Save the Word document to the specified location.
@@ -356,9 +476,71 @@ def save_document(document: docx.Document, save_loc: str, file_name: str) -> Non
         # Construct the full save path
         save_path = os.path.join(save_loc, file_name)
 
-        # Save the document
-        document.save(save_path)
+        # Save the document in memory and write the file in one go: zipfile writes every
+        # part with many small writes and seeks, and a failed save leaves no partial file.
+        # Once the file is closed it can be opened by Word right away, no wait is needed.
+        buffer = io.BytesIO()
+        _save_package(document, buffer)
+        with open(save_path, "wb") as docx_file:
+            docx_file.write(buffer.getbuffer())
         logging.info("Document saved successfully at: %s", save_path)
     except Exception as e:
         logging.error("Failed to save document: %s", e)
         raise
+
+
+def worker_count(reserve: int = 0) -> int:
+    """
+    Number of worker processes for a process pool: one per CPU, minus `reserve` CPUs that are
+    left for the main process, and at most MAX_WORKER_PROCESSES.
+
+    Args:
+        reserve (int): Number of CPUs not to use for workers.
+
+    Returns:
+        int: Number of worker processes, at least 1.
+    """
+    return max(1, min(MAX_WORKER_PROCESSES, (os.cpu_count() or 1) - reserve))
+
+
+def _init_worker_logging(log_queue, log_level: int) -> None:
+    """
+    Initializer of the worker processes of `worker_process_pool`: all log records of the
+    worker are put on the queue, to be written by the handlers of the main process.
+    """
+    logger = logging.getLogger()
+    logger.handlers[:] = [logging.handlers.QueueHandler(log_queue)]
+    logger.setLevel(log_level)
+
+
+@contextlib.contextmanager
+def worker_process_pool(max_workers: int):
+    """
+    Context manager for a ProcessPoolExecutor whose workers log to the handlers of this process,
+    i.e. to the log file and console set up by `setup_logger`.
+
+    On Windows the worker processes are spawned and do not run `setup_logger` themselves. Their
+    log records are therefore sent over a queue and written here by a QueueListener.
+
+    Args:
+        max_workers (int): Number of worker processes, see `worker_count`.
+
+    Yields:
+        concurrent.futures.ProcessPoolExecutor: The process pool.
+    """
+    root_logger = logging.getLogger()
+    log_queue = multiprocessing.Queue()
+    listener = logging.handlers.QueueListener(
+        log_queue, *root_logger.handlers, respect_handler_level=True
+    )
+    listener.start()
+    try:
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker_logging,
+            initargs=(log_queue, root_logger.level),
+        ) as executor:
+            yield executor
+    finally:
+        # Writes the records that are still in the queue before returning
+        listener.stop()
@@ -14,9 +14,13 @@ It includes functionalities to:
 """
 
 # Built-in modules
+import datetime
+import io
 import logging
 import os
 import re
+import zipfile
+from typing import Optional, Sequence, Tuple
 
 # External modules
 import openpyxl
@@ -24,6 +28,11 @@ import pandas as pd
 import win32com.client
 from openpyxl.cell.rich_text import CellRichText, TextBlock
 from openpyxl.cell.text import InlineFont
+from openpyxl.writer.excel import ExcelWriter
+
+# Deflate level for saved workbooks; the sheet XML compresses well at level 1 already,
+# while the default level 6 costs noticeably more CPU time on large sheets
+WORKBOOK_COMPRESSLEVEL = 1
 
 
 def load_workbook(path: str) -> openpyxl.Workbook:
@@ -155,9 +164,7 @@ def save_and_finalize_workbook(wb: openpyxl.Workbook, variables: dict, save_dir:
     filepath_excel = os.path.join(save_dir, filename_excel)
 
     # Create save directory if it doesn't exist
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
-        logging.info(f"Created directory: {save_dir}")
+    os.makedirs(save_dir, exist_ok=True)
 
     # Remove 'Document map' sheet if it exists
     if "Document map" in wb.sheetnames:
@@ -170,9 +177,21 @@ def save_and_finalize_workbook(wb: openpyxl.Workbook, variables: dict, save_dir:
     for sheet in wb:
         sheet.views.sheetView[0].tabSelected = True
 
-    # Save the workbook
+    # Save the workbook in memory first with a lower deflate level and write the file in one go.
+    # ExcelWriter skips the bookkeeping of wb.save, so the modified time is set here.
     logging.debug(f"Saving workbook to {filepath_excel}...")
-    wb.save(filepath_excel)
+    wb.properties.modified = datetime.datetime.now(tz=datetime.timezone.utc).replace(tzinfo=None)
+    buffer = io.BytesIO()
+    archive = zipfile.ZipFile(
+        buffer,
+        "w",
+        compression=zipfile.ZIP_DEFLATED,
+        compresslevel=WORKBOOK_COMPRESSLEVEL,
+        allowZip64=True,
+    )
+    ExcelWriter(wb, archive).save()
+    with open(filepath_excel, "wb") as xlsx_file:
+        xlsx_file.write(buffer.getbuffer())
     logging.info(f"Workbook saved: {filename_excel}")
 
     return filepath_excel
@@ -194,32 +213,176 @@ def styling_bijlage3_export(worksheet, excel: win32com.client.Dispatch) -> None:
         worksheet.AutoFilterMode = False
     worksheet.Rows.Hidden = False
 
+    # Every attribute access below is a COM call into Excel, so the PageSetup object
+    # and the converted margins are looked up once
+    page_setup = worksheet.PageSetup
+    margin_1_91 = excel.Application.CentimetersToPoints(1.91)
+    margin_0_64 = excel.Application.CentimetersToPoints(0.64)
+    margin_0_76 = excel.Application.CentimetersToPoints(0.76)
+
     # Hide the part Inspectieplan in coloms BB:BG
-    worksheet.PageSetup.PrintArea = "A:CB"
+    page_setup.PrintArea = "A:CB"
     worksheet.Columns("BB:BG").Hidden = True
 
     # Set version label
     worksheet.Range("K5").Value = "1.0 - Definitief"
 
     # Set margins
-    worksheet.PageSetup.TopMargin = excel.Application.CentimetersToPoints(1.91)
-    worksheet.PageSetup.BottomMargin = excel.Application.CentimetersToPoints(1.91)
-    worksheet.PageSetup.LeftMargin = excel.Application.CentimetersToPoints(0.64)
-    worksheet.PageSetup.RightMargin = excel.Application.CentimetersToPoints(0.64)
-    worksheet.PageSetup.HeaderMargin = excel.Application.CentimetersToPoints(0.76)
-    worksheet.PageSetup.FooterMargin = excel.Application.CentimetersToPoints(0.76)
-    worksheet.PageSetup.PaperSize = 8  # A3 format
-    worksheet.PageSetup.Orientation = 2  # Landscape mode
+    page_setup.TopMargin = margin_1_91
+    page_setup.BottomMargin = margin_1_91
+    page_setup.LeftMargin = margin_0_64
+    page_setup.RightMargin = margin_0_64
+    page_setup.HeaderMargin = margin_0_76
+    page_setup.FooterMargin = margin_0_76
+    page_setup.PaperSize = 8  # A3 format
+    page_setup.Orientation = 2  # Landscape mode
 
     # Set title rows and print area
-    worksheet.PageSetup.FitToPagesWide = 1
-    worksheet.PageSetup.FitToPagesTall = False
-    worksheet.PageSetup.PrintTitleRows = "$8:$11"
+    page_setup.FitToPagesWide = 1
+    page_setup.FitToPagesTall = False
+    page_setup.PrintTitleRows = "$8:$11"
 
     return None  # Modified worksheet in place
 
 
-def export_to_pdf(excel_path: str, pdf_path: str, sheet_name: str = None) -> None:
+# Excel settings that are switched off while exporting, with their value during the export
+XL_CALCULATION_MANUAL = -4135
+EXCEL_SUSPEND_SETTINGS = {
+    "Calculation": XL_CALCULATION_MANUAL,
+    "ScreenUpdating": False,
+    "EnableEvents": False,
+    "DisplayStatusBar": False,
+    "Interactive": False,
+}
+
+
+def _suspend_excel(excel, state: dict) -> None:
+    """
+    Switch off recalculation, screen updates and events in Excel, so changes to the
+    workbook (e.g. the page setup) do not trigger a recalculation or repaint each.
+    Call `excel.Calculate()` before exporting, so the exported values are up to date.
+
+    Parameters:
+        excel: The Excel application (COM object).
+        state (dict): Filled with the original values of the changed settings, for
+            `_restore_excel`. Settings changed before a failure are recorded as well.
+    """
+    for setting, value in EXCEL_SUSPEND_SETTINGS.items():
+        state[setting] = getattr(excel, setting)
+        setattr(excel, setting, value)
+
+
+def _restore_excel(excel, state: dict) -> None:
+    """
+    Restore the Excel settings changed by `_suspend_excel`.
+
+    Parameters:
+        excel: The Excel application (COM object).
+        state (dict): The original values of the settings.
+    """
+    for setting, value in state.items():
+        setattr(excel, setting, value)
+
+
+class ExcelSession:
+    """
+    A single Excel instance (COM automation, Windows only) that is reused for several workbooks.
+    Starting Excel takes seconds, so a batch opens it once instead of once per workbook.
+
+    Usage:
+        with ExcelSession() as session:
+            for excel_path, pdf_path in jobs:
+                session.export_to_pdf(excel_path, pdf_path)
+
+    Parameters:
+        new_instance (bool): Always start a separate Excel instance (DispatchEx), instead of
+            attaching to a running one. Needed when several processes use Excel in parallel.
+    """
+
+    def __init__(self, new_instance: bool = False):
+        self.new_instance = new_instance
+        self.excel = None
+
+    def __enter__(self) -> "ExcelSession":
+        logging.debug("Starting Excel...")
+        if self.new_instance:
+            self.excel = win32com.client.DispatchEx("Excel.Application")
+        else:
+            self.excel = win32com.client.Dispatch("Excel.Application")
+        self.excel.Visible = False
+        self.excel.DisplayAlerts = False  # Suppress pop-up alerts
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.excel is not None:
+            logging.debug("Closing Excel...")
+            self.excel.Quit()
+            self.excel = None
+
+    def export_to_pdf(self, excel_path: str, pdf_path: str, sheet_name: str = None) -> None:
+        """
+        Export an Excel file to PDF in this Excel instance. Only the workbook is opened and closed.
+        This emulates the steps "File" > "Export" > "Create PDF/XPS Document".
+
+        Parameters:
+            excel_path (str): Path to the Excel file.
+            pdf_path (str): Path where the PDF should be saved.
+            sheet_name (str, optional): Name of the sheet to export. If None, all sheets are exported.
+
+        Raises:
+            RuntimeError: If export fails.
+        """
+        self.export_many_to_pdf(excel_path, [(pdf_path, sheet_name)])
+
+    def export_many_to_pdf(self, excel_path: str, exports: Sequence[Tuple[str, Optional[str]]]) -> None:
+        """
+        Export one Excel file to several PDFs (e.g. one per sheet), opening the workbook only once.
+
+        Parameters:
+            excel_path (str): Path to the Excel file.
+            exports (list): List of tuples (pdf_path, sheet_name). If sheet_name is None,
+                all sheets are exported to that PDF.
+
+        Raises:
+            RuntimeError: If export fails.
+        """
+        # Create save directories if they don't exist
+        for save_dir in {os.path.dirname(pdf_path) for pdf_path, _ in exports}:
+            os.makedirs(save_dir, exist_ok=True)
+        try:
+            wb = self.excel.Workbooks.Open(excel_path)
+            state = {}
+            try:
+                # Calculation can only be changed with a workbook open; the workbook
+                # is already calculated on opening
+                _suspend_excel(self.excel, state)
+                for pdf_path, sheet_name in exports:
+                    if sheet_name:
+                        # Export the specified sheet
+                        ws = wb.Worksheets(sheet_name)
+                        # Set the page styling before printing
+                        # Not generic, but for Bijlage 3 it will do
+                        styling_bijlage3_export(ws, self.excel)
+
+                        # Calculation is manual, so the formulas that depend on the changed
+                        # cells (e.g. the version label) are recalculated once before printing
+                        self.excel.Calculate()
+                        ws.ExportAsFixedFormat(0, pdf_path)  # 0 = PDF
+                    else:
+                        # Export all sheets
+                        self.excel.Calculate()
+                        wb.ExportAsFixedFormat(0, pdf_path)  # 0 = PDF
+            finally:
+                try:
+                    _restore_excel(self.excel, state)
+                finally:
+                    wb.Close(False)
+        except Exception as e:
+            raise RuntimeError(f"Failed to export Excel to PDF: {e}")
+
+
+def export_to_pdf(excel_path: str, pdf_path: str, sheet_name: str = None,
+                  session: ExcelSession = None) -> None:
     """
     Export an Excel file to PDF using Excel's built-in functionality via COM automation (Windows only).
     This emulates the steps "File" > "Export" > "Create PDF/XPS Document".
@@ -228,35 +391,19 @@ def export_to_pdf(excel_path: str, pdf_path: str, sheet_name: str = None) -> Non
         excel_path (str): Path to the Excel file.
         pdf_path (str): Path where the PDF should be saved.
         sheet_name (str, optional): Name of the sheet to export. If None, all sheets are exported.
+        session (ExcelSession, optional): Running Excel instance to reuse. If None, Excel is
+            started for this export and closed afterwards.
 
     Raises:
         RuntimeError: If export fails.
     """
-    # Create save directory if it doesn't exist
-    save_dir = os.path.dirname(pdf_path)
-    if not os.path.exists(save_dir):
-        os.makedirs(save_dir)
-        logging.info(f"Created directory: {save_dir}")
+    if session is not None:
+        session.export_to_pdf(excel_path, pdf_path, sheet_name)
+        return
     try:
-        import win32com.client
-
-        excel = win32com.client.Dispatch("Excel.Application")
-        excel.Visible = False
-        excel.DisplayAlerts = False  # Suppress pop-up alerts
-        wb = excel.Workbooks.Open(excel_path)
-        if sheet_name:
-            # Export the specified sheet
-            ws = wb.Worksheets(sheet_name)
-            # Set the page styling before printing
-            # Not generic, but for Bijlage 3 it will do
-            styling_bijlage3_export(ws, excel)
-
-            ws.ExportAsFixedFormat(0, pdf_path)  # 0 = PDF
-        else:
-            # Export all sheets
-            wb.ExportAsFixedFormat(0, pdf_path)  # 0 = PDF
-        wb.Close(False)
-        excel.Quit()
+        with ExcelSession() as session:
+            session.export_to_pdf(excel_path, pdf_path, sheet_name)
+    except RuntimeError:
+        raise
     except Exception as e:
         raise RuntimeError(f"Failed to export Excel to PDF: {e}")
-        raise RuntimeError(f"Failed to export Excel to PDF: {e}")
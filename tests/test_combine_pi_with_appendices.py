@@ -0,0 +1,142 @@
+# IAK Reporting Tool - combine PI report with appendices tests
+# Copyright (C) 2024-2025 Arcadis Nederland B.V.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+# See LICENSE file for full license text.
+
+import json
+import os
+
+import pytest
+
+from IAK_Report import combine_pi_with_appendices as combine
+
+
+@pytest.fixture
+def pdf_path(tmp_path):
+    path = tmp_path / "PI rapport 07C-002-01.pdf"
+    path.write_bytes(b"%PDF-1.7\n" + b"x" * 1000)
+    return str(path)
+
+
+@pytest.fixture
+def searches(monkeypatch):
+    """Replaces the PDF text search, recording the texts searched for per call."""
+    calls = []
+    pages = {"bijlage 3": 4, "bijlage 9": None}
+
+    def find_last_pages_with_texts(pdf_path, search_texts):
+        calls.append(list(search_texts))
+        return {search_text: pages[search_text] for search_text in search_texts}
+
+    monkeypatch.setattr(combine, "find_last_pages_with_texts", find_last_pages_with_texts)
+    return calls
+
+
+def test_insertion_cache_key_changes_with_the_file(pdf_path):
+    key = combine._insertion_cache_key(pdf_path)
+    assert combine._insertion_cache_key(pdf_path) == key
+
+    os.utime(pdf_path, (1, 1))
+    assert combine._insertion_cache_key(pdf_path) != key
+
+
+def test_find_last_pages_cached_reuses_found_pages(pdf_path, tmp_path, searches):
+    cache_dir = str(tmp_path / "cache")
+
+    first = combine.find_last_pages_cached(pdf_path, ["bijlage 3"], cache_dir)
+    second = combine.find_last_pages_cached(pdf_path, ["bijlage 3"], cache_dir)
+
+    assert first == second == {"bijlage 3": 4}
+    assert searches == [["bijlage 3"]]
+
+
+def test_find_last_pages_cached_searches_not_found_pages_again(pdf_path, tmp_path, searches):
+    cache_dir = str(tmp_path / "cache")
+
+    combine.find_last_pages_cached(pdf_path, ["bijlage 3", "bijlage 9"], cache_dir)
+    result = combine.find_last_pages_cached(pdf_path, ["bijlage 3", "bijlage 9"], cache_dir)
+
+    assert result == {"bijlage 3": 4, "bijlage 9": None}
+    assert searches == [["bijlage 3", "bijlage 9"], ["bijlage 9"]]
+
+
+def test_find_last_pages_cached_replaces_results_of_a_changed_pdf(pdf_path, tmp_path, searches):
+    cache_dir = str(tmp_path / "cache")
+
+    combine.find_last_pages_cached(pdf_path, ["bijlage 3"], cache_dir)
+    os.utime(pdf_path, (1, 1))
+    combine.find_last_pages_cached(pdf_path, ["bijlage 3"], cache_dir)
+
+    assert searches == [["bijlage 3"], ["bijlage 3"]]
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_prune_insertion_cache_removes_entries_of_deleted_pdfs(pdf_path, tmp_path, searches):
+    cache_dir = str(tmp_path / "cache")
+    combine.find_last_pages_cached(pdf_path, ["bijlage 3"], cache_dir)
+    (cache_file,) = os.listdir(cache_dir)
+    with open(os.path.join(cache_dir, cache_file)) as file:
+        assert json.load(file)["source"] == pdf_path
+
+    combine.prune_insertion_cache(cache_dir)
+    assert os.listdir(cache_dir) == [cache_file]
+
+    os.remove(pdf_path)
+    combine.prune_insertion_cache(cache_dir)
+    assert os.listdir(cache_dir) == []
+
+
+def test_prune_insertion_cache_without_cache_dir(tmp_path):
+    combine.prune_insertion_cache(str(tmp_path / "missing"))
+
+
+@pytest.fixture
+def object_dir(tmp_path):
+    """Object folder with the input PDFs and, newer than those, the combined PDF."""
+    object_path = tmp_path / "object"
+    output_dir = object_path / "output"
+    output_dir.mkdir(parents=True)
+    for name in ("PI rapport X.pdf", "Bijlage 3 X.pdf", "Bijlage 6 X.pdf", "Bijlage 9 X.pdf"):
+        (output_dir / name).write_bytes(b"%PDF")
+        os.utime(output_dir / name, (1000, 1000))
+    (output_dir / "PI rapport X - compleet.pdf").write_bytes(b"%PDF")
+    os.utime(output_dir / "PI rapport X - compleet.pdf", (2000, 2000))
+    return object_path
+
+
+def test_combined_pdf_is_up_to_date(object_dir):
+    assert combine.combined_pdf_is_up_to_date(str(object_dir), str(object_dir / "output")) == (True, False)
+
+
+def test_combined_pdf_is_outdated_by_a_newer_input(object_dir):
+    os.utime(object_dir / "output" / "Bijlage 9 X.pdf", (3000, 3000))
+    up_to_date, _ = combine.combined_pdf_is_up_to_date(str(object_dir), str(object_dir / "output"))
+    assert not up_to_date
+
+
+def test_combined_pdf_is_outdated_by_a_missing_appendix(object_dir):
+    os.remove(object_dir / "output" / "Bijlage 3 X.pdf")
+    up_to_date, _ = combine.combined_pdf_is_up_to_date(str(object_dir), str(object_dir / "output"))
+    assert not up_to_date
+
+
+def test_find_insertion_points_uses_overrides_without_searching(pdf_path, searches):
+    appendices = [
+        ("bijlage3.pdf", "bijlage 3", "Bijlage 3"),
+        (None, "bijlage 6", "Bijlage 6"),
+        ("bijlage9.pdf", "bijlage 9", "Bijlage 9"),
+    ]
+
+    insertion_points = combine.find_insertion_points(pdf_path, appendices, overrides={"Bijlage 9": -1})
+
+    assert insertion_points == [(4, "bijlage3.pdf", "Bijlage 3"), (None, "bijlage9.pdf", "Bijlage 9")]
+    assert searches == [["bijlage 3"]]
+
+
+def test_validate_insertion_points_appends_out_of_range_pages_at_the_end():
+    insertion_points = [(2, "a.pdf", "A"), (3, "b.pdf", "B"), (None, "c.pdf", "C")]
+
+    assert combine.validate_insertion_points(insertion_points, 3) == [
+        (2, "a.pdf", "A"), (None, "b.pdf", "B"), (None, "c.pdf", "C"),
+    ]
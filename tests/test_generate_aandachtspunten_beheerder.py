@@ -0,0 +1,66 @@
+# IAK Reporting Tool - aandachtspunten beheerder tests
+# Copyright (C) 2024-2025 Arcadis Nederland B.V.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+# See LICENSE file for full license text.
+
+import re
+
+import pandas as pd
+import pytest
+
+from IAK_Report.generate_aandachtspunten_beheerder import (
+    build_foto_index,
+    find_foto_path,
+    list_of_fotonummers,
+)
+
+
+@pytest.fixture
+def fotos(tmp_path):
+    """Photos of an object, by filename; the numbers are the file sizes."""
+    paths = {}
+    for name, size in (("DSCN9252.JPG", 300), ("IMG_9252.jpg", 200), ("Foto 12.png", 100), ("12.jpg", 400)):
+        path = tmp_path / name
+        path.write_bytes(b"x" * size)
+        paths[name] = str(path)
+    return paths
+
+
+def test_build_foto_index_lists_every_image_once_under_the_empty_ending(fotos):
+    foto_index = build_foto_index(list(fotos.values()))
+    assert sorted(fullfilename for _, fullfilename in foto_index[""]) == sorted(fotos.values())
+
+
+def test_find_foto_path_matches_the_end_of_the_name(fotos):
+    foto_index = build_foto_index(list(fotos.values()))
+    assert find_foto_path("DSCN-9252", foto_index) == fotos["DSCN9252.JPG"]
+
+
+def test_find_foto_path_uses_the_smallest_of_several_matches(fotos):
+    foto_index = build_foto_index(list(fotos.values()))
+    foto_sizes = {}
+    assert find_foto_path("9252.jpg", foto_index, foto_sizes) == fotos["IMG_9252.jpg"]
+    assert set(foto_sizes) == {fotos["DSCN9252.JPG"], fotos["IMG_9252.jpg"]}
+
+
+def test_find_foto_path_prefers_an_exact_name(fotos):
+    foto_index = build_foto_index(list(fotos.values()))
+    assert find_foto_path("12", foto_index) == fotos["12.jpg"]
+
+
+def test_find_foto_path_raises_for_a_missing_photo(fotos, tmp_path):
+    foto_index = build_foto_index(list(fotos.values()))
+    with pytest.raises(FileNotFoundError, match=re.escape(str(tmp_path))):
+        find_foto_path("1234", foto_index)
+
+
+def test_find_foto_path_raises_for_an_invalid_extension(fotos):
+    foto_index = build_foto_index(list(fotos.values()))
+    with pytest.raises(ValueError):
+        find_foto_path("9252.tif", foto_index)
+
+
+def test_list_of_fotonummers_splits_on_commas_and_semicolons():
+    fotonummers = pd.Series(["1, 2;3", " 4 ", 5, None, "nan", ";,"])
+    assert list_of_fotonummers(fotonummers).tolist() == [["1", "2", "3"], ["4"], ["5"], [], [], []]
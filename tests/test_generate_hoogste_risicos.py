@@ -0,0 +1,40 @@
+# IAK Reporting Tool - hoogste risico's tests
+# Copyright (C) 2024-2025 Arcadis Nederland B.V.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+# See LICENSE file for full license text.
+
+import zipfile
+from xml.etree import ElementTree
+
+import pandas as pd
+
+from IAK_Report.generate_hoogste_risicos import extract_relevant_ora_data, save_dataframe_to_excel
+
+
+def test_extract_relevant_ora_data_keeps_risk_scores_of_six_and_higher():
+    ora = pd.DataFrame({
+        "Actuele Risicoscore": [6.0, 5.0, None, 12.0, 9.0],
+        "Omschrijving": ["a", "b", "c", "d", "e"],
+    })
+
+    ora_risico = extract_relevant_ora_data(ora)
+
+    assert ora_risico["Omschrijving"].tolist() == ["a", "d", "e"]
+    assert ora_risico["Actuele Risicoscore"].tolist() == [6, 12, 9]
+    assert ora_risico["Actuele Risicoscore"].dtype.kind == "i"
+    assert ora["Actuele Risicoscore"].tolist()[:2] == [6.0, 5.0]
+
+
+def test_save_dataframe_to_excel_writes_a_table_with_header_filters(tmp_path):
+    df = pd.DataFrame({"Code": ["07C", "08D", "09E"], "Risico": [6, 9, 12], "Overig": ["x", "y", "z"]})
+
+    save_dataframe_to_excel(df, str(tmp_path), "WP1", {"Code": "Objectcode", "Risico": "Actuele Risicoscore"})
+
+    with zipfile.ZipFile(tmp_path / "WP1 Hoogste Risicos.xlsx") as xlsx:
+        table = ElementTree.fromstring(xlsx.read("xl/tables/table1.xml"))
+    namespace = {"main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main"}
+    assert table.get("ref") == "A1:B4"
+    assert table.find("main:autoFilter", namespace).get("ref") == "A1:B4"
+    columns = table.findall("main:tableColumns/main:tableColumn", namespace)
+    assert [column.get("name") for column in columns] == ["Objectcode", "Actuele Risicoscore"]
@@ -0,0 +1,33 @@
+# IAK Reporting Tool - PI rapportage tests
+# Copyright (C) 2024-2025 Arcadis Nederland B.V.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+# See LICENSE file for full license text.
+
+import openpyxl
+from openpyxl.styles import Border, Font, Side
+
+from IAK_Report.generate_pi_rapportage import write_cells
+
+
+def test_write_cells_keeps_the_other_style_parts():
+    sheet = openpyxl.Workbook().active
+    sheet["H14"].border = Border(left=Side(style="thin"))
+
+    write_cells(sheet, {(14, 8): "Rijkswaterstaat", (9, 4): "Zaaknummer"}, font=Font(name="Arial", size=10))
+
+    assert sheet["H14"].value == "Rijkswaterstaat"
+    assert sheet["D9"].value == "Zaaknummer"
+    assert sheet["H14"].border.left.style == "thin"
+    assert (sheet["H14"].font.name, sheet["H14"].font.sz) == ("Arial", 10)
+    assert (sheet["D9"].font.name, sheet["D9"].font.sz) == ("Arial", 10)
+
+
+def test_write_cells_without_font_keeps_the_font():
+    sheet = openpyxl.Workbook().active
+    sheet["B5"].font = Font(name="Calibri", size=18)
+
+    write_cells(sheet, {(5, 2): "Inspectierapport"})
+
+    assert sheet["B5"].value == "Inspectierapport"
+    assert sheet["B5"].font.sz == 18
@@ -0,0 +1,52 @@
+# IAK Reporting Tool - utils tests
+# Copyright (C) 2024-2025 Arcadis Nederland B.V.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+# See LICENSE file for full license text.
+
+import io
+import zipfile
+
+import docx
+from docx.shared import Cm
+from PIL import Image
+
+from IAK_Report import utils
+
+
+def test_worker_count_uses_one_worker_per_cpu(monkeypatch):
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: 8)
+    assert utils.worker_count() == 8
+    assert utils.worker_count(reserve=1) == 7
+
+
+def test_worker_count_is_capped(monkeypatch):
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: 128)
+    assert utils.worker_count() == utils.MAX_WORKER_PROCESSES
+
+
+def test_worker_count_is_at_least_one(monkeypatch):
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: None)
+    assert utils.worker_count() == 1
+    monkeypatch.setattr(utils.os, "cpu_count", lambda: 1)
+    assert utils.worker_count(reserve=1) == 1
+
+
+def test_save_document_stores_images_uncompressed(tmp_path):
+    image = io.BytesIO()
+    Image.new("RGB", (64, 64), "blue").save(image, "JPEG")
+    document = docx.Document()
+    document.add_paragraph("Aandachtspunt")
+    document.add_picture(image, width=Cm(3))
+    expected = io.BytesIO()
+    document.save(expected)
+
+    utils.save_document(document, str(tmp_path), "document.docx")
+
+    with zipfile.ZipFile(tmp_path / "document.docx") as saved, zipfile.ZipFile(expected) as reference:
+        assert saved.namelist() == reference.namelist()
+        for info in saved.infolist():
+            assert saved.read(info) == reference.read(info.filename)
+            is_image = info.filename.endswith(utils.PRECOMPRESSED_MEDIA_EXTENSIONS)
+            assert info.compress_type == (zipfile.ZIP_STORED if is_image else zipfile.ZIP_DEFLATED)
+    assert docx.Document(str(tmp_path / "document.docx")).paragraphs[0].text == "Aandachtspunt"